@@ -3,17 +3,35 @@
 from __future__ import annotations
 
 import json
-
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+import threading
+from typing import TYPE_CHECKING
 
 from .logging import LoggingHttp, get_logger
-from .paths import CLIENT_SECRET_FILE, CONFIG_DIR, TOKEN_FILE
+from .paths import (
+    CLIENT_SECRET_FILE,
+    CONFIG_DIR,
+    CONTACTS_CACHE_FILE,
+    FROM_ADDRESS_CACHE_FILE,
+    TOKEN_FILE,
+)
+
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
 
 logger = get_logger(__name__)
 
+# Per-thread cache of built services and their transport. httplib2.Http is not
+# thread-safe, so each thread gets its own; within a thread, every service
+# shares one keep-alive connection pool and repeated get_gmail() etc. calls
+# reuse the same service instead of re-parsing discovery and re-reading the
+# token file.
+_services = threading.local()
+
+# Credentials are resolved once per process and shared by every thread, so
+# worker threads don't each re-read the token file or race to refresh it.
+_credentials: Credentials | None = None
+_credentials_lock = threading.Lock()
+
 # Embedded OAuth credentials for public distribution.
 # These are inherently non-secret for desktop/CLI apps per Google's OAuth model.
 # User tokens are what must be protected (stored with 0600 permissions).
@@ -54,12 +72,24 @@ SCOPES_READONLY = [
 ]
 
 
+def clear_account_caches() -> None:
+    """Delete on-disk caches that hold data for the signed-in account.
+
+    Called whenever credentials are replaced or removed, since the next
+    sign-in may be a different Google account.
+    """
+    FROM_ADDRESS_CACHE_FILE.unlink(missing_ok=True)
+    CONTACTS_CACHE_FILE.unlink(missing_ok=True)
+
+
 def _run_oauth_flow(readonly: bool = False) -> Credentials:
     """Run OAuth flow to get new credentials.
 
     Uses user-provided client_secret.json if present, otherwise falls back
     to embedded credentials.
     """
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
     scopes = SCOPES_READONLY if readonly else SCOPES_FULL
     scope_type = "read-only" if readonly else "full"
     logger.info(f"Starting OAuth flow ({scope_type} access)")
@@ -71,12 +101,28 @@ def _run_oauth_flow(readonly: bool = False) -> Credentials:
         flow = InstalledAppFlow.from_client_config(EMBEDDED_CLIENT_CONFIG, scopes)
     creds = flow.run_local_server(port=0)
     _save_token(creds)
+    # The user may have signed in as a different account
+    clear_account_caches()
     logger.info("OAuth flow complete")
     return creds
 
 
 def get_credentials() -> Credentials:
+    """Get credentials for this process, reloading only once they expire."""
+    global _credentials
+    with _credentials_lock:
+        if _credentials is None or _credentials.expired:
+            _credentials = _load_credentials()
+        return _credentials
+
+
+def _load_credentials() -> Credentials:
     """Load credentials, refreshing if needed. Runs OAuth flow if no token exists."""
+    # The google-auth transport stack is imported here rather than at module
+    # level so that CLI startup and --help don't pay for it.
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
     if not TOKEN_FILE.exists():
@@ -168,6 +214,8 @@ def build_service(service_name: str, version: str):
     """Build a Google API service with automatic request logging.
 
     All API requests (GET, POST, PUT, DELETE, PATCH) are logged automatically.
+    Services are cached per thread, so repeated calls are cheap, and services
+    built on the same thread share one authorized HTTP transport.
 
     Args:
         service_name: API service name (e.g., "gmail", "calendar", "drive")
@@ -176,10 +224,25 @@ def build_service(service_name: str, version: str):
     Returns:
         Google API service resource with logging enabled.
     """
-    import google_auth_httplib2
-    import httplib2
-
-    creds = get_credentials()
-    authorized_http = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http())
-    logging_http = LoggingHttp(authorized_http)
-    return build(service_name, version, http=logging_http)
+    cache = getattr(_services, "cache", None)
+    if cache is None:
+        cache = _services.cache = {}
+    key = (service_name, version)
+    if key in cache:
+        return cache[key]
+
+    from googleapiclient.discovery import build
+
+    logging_http = getattr(_services, "http", None)
+    if logging_http is None:
+        import google_auth_httplib2
+        import httplib2
+
+        creds = get_credentials()
+        authorized_http = google_auth_httplib2.AuthorizedHttp(
+            creds, http=httplib2.Http()
+        )
+        logging_http = _services.http = LoggingHttp(authorized_http)
+    service = build(service_name, version, http=logging_http)
+    cache[key] = service
+    return service
@@ -10,7 +10,13 @@ import click
 
 from googleapiclient.errors import HttpError
 
-from .auth import SCOPES_FULL, SCOPES_READONLY, TOKEN_FILE, run_auth
+from .auth import (
+    SCOPES_FULL,
+    SCOPES_READONLY,
+    TOKEN_FILE,
+    clear_account_caches,
+    run_auth,
+)
 from .config import (
     CONFIG_FILE,
     get_config,
@@ -81,6 +87,7 @@ def auth(readonly: bool, logout: bool):
     if logout:
         if TOKEN_FILE.exists():
             TOKEN_FILE.unlink()
+            clear_account_caches()
             click.echo("Logged out. Credentials removed.")
         else:
             click.echo("Not logged in (no credentials found).")
@@ -37,7 +37,7 @@ class ErrorHandlingGroup(click.Group):
         Subclasses can override to add domain-specific context for 404s etc.
         """
         status = e.resp.status
-        reason = e._get_reason()
+        reason = e.reason
 
         if status == 404:
             return f"Not found: {reason}"
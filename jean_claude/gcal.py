@@ -8,7 +8,6 @@ from datetime import datetime, timedelta
 from urllib.parse import unquote
 
 import click
-import dateparser
 from googleapiclient.errors import HttpError
 
 from .auth import build_service
@@ -162,7 +161,10 @@ def parse_datetime(s: str) -> datetime:
     except ValueError:
         pass
 
-    # Fall back to dateparser for relative dates
+    # Fall back to dateparser for relative dates. Imported here because it
+    # dominates startup time (~200ms) and most commands never reach it.
+    import dateparser
+
     parsed = dateparser.parse(
         s,
         settings={
@@ -7,10 +7,12 @@ Gmail API enforces per-user quota limits: 15,000 units/minute (≈250 units/seco
 
 Quota Costs
 -----------
-- threads.modify: 5 units per thread
-- threads.trash: 5 units per thread
+- threads.get: 10 units per thread
+- threads.modify: 10 units per thread
+- threads.trash: 10 units per thread
 - messages.batchModify: 50 units (up to 1000 messages)
 - messages.get: 5 units per message
+- messages.attachments.get: 5 units per attachment
 - messages.send: 100 units per message
 
 jean-claude Batching Strategy
@@ -18,8 +20,9 @@ jean-claude Batching Strategy
 
 Thread operations (archive, mark-read, mark-unread, unarchive, trash):
     Uses threads.modify or threads.trash API
-    - Cost: 5 units per thread
-    - Processes threads individually with rate limit retry
+    - Cost: 10 units per thread
+    - Sends up to 50 calls per batch HTTP request, retrying a rate-limited
+      batch as a whole
     - Matches Gmail UI behavior (operates on entire conversations)
 
 Message operations (star, unstar):
@@ -28,14 +31,23 @@ Message operations (star, unstar):
     - Cost: 50 units per call regardless of message count
 
 Search operations:
-    Fetches message details in batches of 15
+    Fetches message details in batches of 15, up to 4 batches in flight
     - Cost: 5 units per message
-    - Delay between batches: 0.3 seconds
+
+Pacing
+------
+Bulk operations draw from a client-side token bucket refilled at 250
+units/second, holding at most one second's worth. A batch only waits when
+earlier batches have used up the budget, so small and occasional commands run
+with no delay.
 
 Error Handling
 --------------
-Rate limit errors (429) are automatically retried with exponential backoff:
-    - Retry schedule: 2s, 4s, 8s (max 3 retries, total 14s wait)
+Rate limits (429, or 403 with reason rateLimitExceeded/userRateLimitExceeded)
+and transient server errors (500, 503) are automatically retried, including when they come back inside a batch response:
+    - Waits for the server's Retry-After when provided (up to 60s)
+    - Otherwise backs off exponentially: 2s, 4s, 8s (max 3 retries)
+    - Delays carry up to 10% jitter
     - User feedback during retry via stderr
 
 Troubleshooting Rate Limits
@@ -58,8 +70,13 @@ import functools
 import html
 import json
 import mimetypes
+import os
+import random
 import re
+import threading
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from email import encoders
 from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
@@ -77,7 +94,14 @@ from .errors import ErrorHandlingGroup
 from .input import read_body_stdin, read_stdin_optional
 from .logging import JeanClaudeError, get_logger
 from .pagination import paginated_output
-from .paths import ATTACHMENT_CACHE_DIR, DRAFT_CACHE_DIR, EMAIL_CACHE_DIR
+from .paths import (
+    ATTACHMENT_CACHE_DIR,
+    CONTACTS_CACHE_FILE,
+    DRAFT_CACHE_DIR,
+    EMAIL_CACHE_DIR,
+    FROM_ADDRESS_CACHE_FILE,
+    write_cache_file,
+)
 from .timezone import LOCAL_TZ
 
 logger = get_logger(__name__)
@@ -86,15 +110,20 @@ logger = get_logger(__name__)
 class GmailErrorHandlingGroup(ErrorHandlingGroup):
     """Error handling with Gmail-specific context for 404s."""
 
+    _ATTACHMENT_PATTERN = re.compile(r"/users/me/messages/([^/]+)/attachments/([^/?]+)")
+    _MESSAGE_PATTERN = re.compile(r"/users/me/messages/([^/?]+)")
+    _THREAD_PATTERN = re.compile(r"/users/me/threads/([^/?]+)")
+    _DRAFT_PATTERN = re.compile(r"/users/me/drafts/([^/?]+)")
+    _FILTER_PATTERN = re.compile(r"/users/me/settings/filters/([^/?]+)")
+    _LABEL_PATTERN = re.compile(r"/users/me/labels/([^/?]+)")
+
     def _http_error_message(self, e: HttpError) -> str:
         """Add Gmail-specific context to 404 errors."""
         if e.resp.status == 404:
             url = e.uri if hasattr(e, "uri") else ""
             if url:
                 # Attachment: /users/me/messages/{messageId}/attachments/{attachmentId}
-                if match := re.search(
-                    r"/users/me/messages/([^/]+)/attachments/([^/?]+)", url
-                ):
+                if match := self._ATTACHMENT_PATTERN.search(url):
                     msg_id = unquote(match.group(1))
                     attach_id = unquote(match.group(2))
                     return (
@@ -103,35 +132,35 @@ class GmailErrorHandlingGroup(ErrorHandlingGroup):
                         f"  Tip: Use 'jean-claude gmail attachments {msg_id}' to list attachments"
                     )
                 # Message: /users/me/messages/{messageId}
-                if match := re.search(r"/users/me/messages/([^/?]+)", url):
+                if match := self._MESSAGE_PATTERN.search(url):
                     msg_id = unquote(match.group(1))
                     return (
                         f"Message not found: {msg_id}\n"
                         f"  Tip: Use 'jean-claude gmail search' to find valid message IDs"
                     )
                 # Thread: /users/me/threads/{threadId}
-                if match := re.search(r"/users/me/threads/([^/?]+)", url):
+                if match := self._THREAD_PATTERN.search(url):
                     thread_id = unquote(match.group(1))
                     return (
                         f"Thread not found: {thread_id}\n"
                         f"  Tip: Use 'jean-claude gmail inbox' to find valid thread IDs"
                     )
                 # Draft: /users/me/drafts/{draftId}
-                if match := re.search(r"/users/me/drafts/([^/?]+)", url):
+                if match := self._DRAFT_PATTERN.search(url):
                     draft_id = unquote(match.group(1))
                     return (
                         f"Draft not found: {draft_id}\n"
                         f"  Tip: Use 'jean-claude gmail draft list' to see available drafts"
                     )
                 # Filter: /users/me/settings/filters/{filterId}
-                if match := re.search(r"/users/me/settings/filters/([^/?]+)", url):
+                if match := self._FILTER_PATTERN.search(url):
                     filter_id = unquote(match.group(1))
                     return (
                         f"Filter not found: {filter_id}\n"
                         f"  Tip: Use 'jean-claude gmail filter list' to see available filters"
                     )
                 # Label: /users/me/labels/{labelId}
-                if match := re.search(r"/users/me/labels/([^/?]+)", url):
+                if match := self._LABEL_PATTERN.search(url):
                     label_id = unquote(match.group(1))
                     return (
                         f"Label not found: {label_id}\n"
@@ -140,11 +169,15 @@ class GmailErrorHandlingGroup(ErrorHandlingGroup):
         return super()._http_error_message(e)
 
 
+@functools.lru_cache(maxsize=4096)
 def _convert_to_local_time(date_str: str) -> str:
     """Convert RFC 2822 date string to local time ISO format.
 
     Input:  "Sun, 28 Dec 2025 07:01:08 +0000"
     Output: "2025-12-27T23:01:08-08:00" (in user's local timezone)
+
+    Cached: thread summaries convert the latest message's date twice, and the
+    RFC 2822 parser is pure Python.
     """
     if not date_str:
         return date_str
@@ -160,9 +193,38 @@ def get_people():
     return build_service("people", "v1")
 
 
+_FROM_ADDRESS_CACHE_TTL = 24 * 60 * 60
+
+
 def get_my_from_address(service=None) -> str:
     """Get the user's From address with display name.
 
+    The address rarely changes, so it's cached on disk for a day to save the
+    settings/profile round trips on every draft. See _fetch_from_address for
+    how it's resolved.
+    """
+    try:
+        cached = json.loads(FROM_ADDRESS_CACHE_FILE.read_text(encoding="utf-8"))
+        if time.time() - cached["timestamp"] < _FROM_ADDRESS_CACHE_TTL:
+            return cached["address"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    address = _fetch_from_address(service)
+    try:
+        _ensure_dir(FROM_ADDRESS_CACHE_FILE.parent)
+        write_cache_file(
+            FROM_ADDRESS_CACHE_FILE,
+            json.dumps({"address": address, "timestamp": time.time()}),
+        )
+    except OSError as e:
+        logger.debug("Failed to write from-address cache", error=str(e))
+    return address
+
+
+def _fetch_from_address(service=None) -> str:
+    """Look up the user's From address with display name from the API.
+
     Checks sources in order of preference:
     1. Gmail send-as displayName (explicit user configuration)
     2. Google Account profile name via People API (requires userinfo.profile scope)
@@ -237,17 +299,62 @@ def _get_profile_display_name() -> str | None:
     return None
 
 
+# Contact names change rarely; re-check each address at most weekly.
+_CONTACTS_CACHE_TTL = 7 * 24 * 60 * 60
+
+
+@functools.cache
+def _contacts_disk_cache() -> dict[str, list]:
+    """Load unexpired contact lookups persisted across CLI invocations.
+
+    Maps lowercase email to [display name or None, lookup timestamp]. A None
+    name records "not a contact" so misses aren't re-queried either.
+    """
+    try:
+        data = json.loads(CONTACTS_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    cutoff = time.time() - _CONTACTS_CACHE_TTL
+    return {
+        email: entry
+        for email, entry in data.items()
+        if isinstance(entry, list)
+        and len(entry) == 2
+        and isinstance(entry[1], (int, float))
+        and entry[1] > cutoff
+    }
+
+
+def _remember_contact_names(names: dict[str, str | None]) -> None:
+    """Record lookup results in the on-disk contacts cache."""
+    cache = _contacts_disk_cache()
+    now = time.time()
+    for email, name in names.items():
+        cache[email] = [name, now]
+    try:
+        _ensure_dir(CONTACTS_CACHE_FILE.parent)
+        write_cache_file(CONTACTS_CACHE_FILE, json.dumps(cache))
+    except OSError as e:
+        logger.debug("Failed to write contacts cache", error=str(e))
+
+
 @functools.cache
 def _lookup_contact_name(email: str) -> str | None:
     """Look up display name for an email address from Google Contacts.
 
     Uses searchContacts API for efficient per-email lookup. Results are cached
-    for the CLI session to avoid duplicate lookups.
+    for the CLI session, and on disk for a week (see _contacts_disk_cache), to
+    avoid repeat lookups.
 
     Requires contacts scope. Shows warning if scope not granted.
     """
     email = email.lower()
 
+    if (entry := _contacts_disk_cache().get(email)) is not None:
+        return entry[0]
+
     try:
         result = (
             get_people()
@@ -260,15 +367,20 @@ def _lookup_contact_name(email: str) -> str | None:
         return None
 
     # Find exact email match (searchContacts does prefix matching)
+    name = None
     for person in result.get("results", []):
         person_data = person.get("person", {})
         for email_addr in person_data.get("emailAddresses", []):
             if email_addr.get("value", "").lower() == email:
                 names = person_data.get("names", [])
                 if names:
-                    return names[0].get("displayName")
+                    name = names[0].get("displayName")
+                    break
+        if name:
+            break
 
-    return None
+    _remember_contact_names({email: name})
+    return name
 
 
 def _format_recipients(addresses: str) -> str:
@@ -301,18 +413,77 @@ def _format_recipients(addresses: str) -> str:
     return ", ".join(formatted)
 
 
+# 429 is rate limiting; 500/503 are transient backend errors Google documents
+# as safe to retry with backoff.
+_RETRYABLE_STATUSES = frozenset({429, 500, 503})
+# Gmail sometimes reports per-user rate limiting as 403 with one of these reasons
+_RATE_LIMIT_REASONS = frozenset({"rateLimitExceeded", "userRateLimitExceeded"})
+# Longest server-requested Retry-After we'll sleep for; beyond this a CLI call
+# is better off failing than hanging.
+_MAX_RETRY_AFTER = 60.0
+
+
+def _is_rate_limited(e: HttpError) -> bool:
+    """Check whether an HttpError is a rate limit (429, or 403 with a rate reason).
+
+    Reads the legacy error.errors[*].reason list from the body rather than
+    e.error_details: when a response also carries a google.rpc "details"
+    list, error_details holds that instead, and its ErrorInfo reasons
+    (RATE_LIMIT_EXCEEDED) don't match. googleapiclient's own retry check
+    reads errors for the same reason.
+    """
+    if e.resp.status == 429:
+        return True
+    if e.resp.status != 403:
+        return False
+    try:
+        errors = json.loads(e.content)["error"]["errors"]
+    except (ValueError, KeyError, TypeError):
+        return False
+    if not isinstance(errors, list):
+        return False
+    return any(
+        isinstance(error, dict) and error.get("reason") in _RATE_LIMIT_REASONS
+        for error in errors
+    )
+
+
+def _is_retryable(e: HttpError) -> bool:
+    """Check whether an HttpError is worth retrying."""
+    return e.resp.status in _RETRYABLE_STATUSES or _is_rate_limited(e)
+
+
 def _wrap_batch_error(request_id: str, exception: Exception) -> NoReturn:
-    """Raise a wrapped exception with context about which ID failed."""
-    if isinstance(exception, HttpError) and exception.resp.status == 404:
-        raise JeanClaudeError(f"Not found: {request_id}") from exception
+    """Raise a wrapped exception with context about which ID failed.
+
+    Retryable errors propagate unwrapped so _retry_on_rate_limit around the
+    batch can re-run it. So do 404s that carry their request URI, letting
+    GmailErrorHandlingGroup name the missing message/thread and give a tip.
+    """
+    if isinstance(exception, HttpError):
+        if _is_retryable(exception):
+            raise exception
+        if exception.resp.status == 404 and getattr(exception, "uri", None):
+            raise exception
+        if exception.resp.status == 404:
+            raise JeanClaudeError(f"Not found: {request_id}") from exception
     raise JeanClaudeError(f"Error processing {request_id}: {exception}") from exception
 
 
-def _batch_callback(responses: dict):
-    """Create a batch callback that stores responses by request_id."""
+def _batch_callback(responses: dict, errors: dict | None = None):
+    """Create a batch callback that stores responses by request_id.
+
+    If errors is given, non-retryable failures are stored there by request_id
+    instead of raised, so one bad item doesn't fail the whole batch.
+    """
 
     def callback(request_id, response, exception):
         if exception:
+            if errors is not None and not (
+                isinstance(exception, HttpError) and _is_retryable(exception)
+            ):
+                errors[request_id] = exception
+                return
             _wrap_batch_error(request_id, exception)
         responses[request_id] = response
 
@@ -325,12 +496,27 @@ def _raise_on_error(request_id, _response, exception):
         _wrap_batch_error(request_id, exception)
 
 
+def _retry_delay(e: HttpError, attempt: int) -> float:
+    """Seconds to wait before a retry.
+
+    Uses the server's Retry-After when given (capped at _MAX_RETRY_AFTER),
+    otherwise exponential backoff (2s, 4s, 8s). Adds up to 10% jitter so
+    concurrent clients don't retry in lockstep.
+    """
+    try:
+        delay = min(float(e.resp.get("retry-after")), _MAX_RETRY_AFTER)
+    except (TypeError, ValueError):
+        delay = 2 ** (attempt + 1)
+    return delay * (1 + random.random() * 0.1)
+
+
 def _retry_on_rate_limit(func, max_retries: int = 3):
     """Execute a function with exponential backoff retry on rate limits.
 
     Args:
         func: Callable that executes a Gmail API request (must call .execute())
-        max_retries: Maximum retry attempts (default 3, giving 2s, 4s, 8s delays)
+        max_retries: Maximum retry attempts (default 3, giving 2s, 4s, 8s delays
+            unless the server sends Retry-After)
 
     Returns:
         The result of func() on success
@@ -343,22 +529,61 @@ def _retry_on_rate_limit(func, max_retries: int = 3):
         try:
             return func()
         except HttpError as e:
-            if e.resp.status == 429:
-                if attempt < max_retries:
-                    delay = 2 ** (attempt + 1)  # 2s, 4s, 8s
-                    logger.warning(
-                        f"Rate limited, retrying in {delay}s",
-                        attempt=attempt + 1,
-                        max_retries=max_retries,
-                    )
-                    time.sleep(delay)
-                    continue
+            if not _is_retryable(e):
+                raise
+            rate_limited = _is_rate_limited(e)
+            if attempt < max_retries:
+                delay = _retry_delay(e, attempt)
+                logger.warning(
+                    f"{'Rate limited' if rate_limited else 'Server error'}, "
+                    f"retrying in {delay:.1f}s",
+                    status=e.resp.status,
+                    attempt=attempt + 1,
+                    max_retries=max_retries,
+                )
+                time.sleep(delay)
+                continue
+            if rate_limited:
                 raise JeanClaudeError(
                     f"Gmail API rate limit exceeded after {max_retries} retries."
                 )
             raise
 
 
+class _TokenBucket:
+    """Thread-safe token bucket for pacing requests against a quota.
+
+    consume() never refuses: it reserves the tokens, letting the balance go
+    negative, and sleeps until that debt would have been refilled. The first
+    request after an idle period goes out immediately, and sustained use
+    averages out to ``rate``.
+    """
+
+    def __init__(self, capacity: float, rate: float):
+        self.capacity = capacity
+        self.rate = rate
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, tokens: float) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            wait = max(0.0, -self._tokens) / self.rate
+            self._tokens -= tokens
+        if wait:
+            logger.debug(f"Pacing Gmail requests, waiting {wait:.2f}s")
+            time.sleep(wait)
+
+
+# Gmail's per-user limit is 250 quota units/second (moving average)
+_gmail_quota = _TokenBucket(capacity=250, rate=250)
+
+
 def _batch_modify_labels(
     service,
     message_ids: list[str],
@@ -400,87 +625,166 @@ def _batch_modify_labels(
         if remove_label_ids:
             body["removeLabelIds"] = remove_label_ids
 
-        _retry_on_rate_limit(
-            lambda b=body: service.users()
-            .messages()
-            .batchModify(userId="me", body=b)
-            .execute()
-        )
+        def execute(b=body):
+            _gmail_quota.consume(50)
+            return service.users().messages().batchModify(userId="me", body=b).execute()
+
+        _retry_on_rate_limit(execute)
         logger.debug(
             f"Processed {i + len(chunk)}/{len(message_ids)} messages",
             chunk_size=len(chunk),
         )
 
-        # Add small delay between 1000-message chunks (only needed for 1000+ messages)
-        if i + chunk_size < len(message_ids):
-            time.sleep(0.5)
-
 
 def _modify_thread_labels(
     service,
     thread_ids: list[str],
     add_label_ids: list[str] | None = None,
     remove_label_ids: list[str] | None = None,
-):
+) -> int:
     """Modify labels on entire threads using Gmail's threads.modify API.
 
     This modifies all messages in each thread atomically, matching Gmail UI behavior.
     When you archive a thread in Gmail's UI, all messages in that thread are archived.
 
+    Calls are sent as batch HTTP requests of up to 50 threads each.
+
     Args:
         service: Gmail API service instance
         thread_ids: List of thread IDs to process
         add_label_ids: Label IDs to add (e.g., ["STARRED", "INBOX"])
         remove_label_ids: Label IDs to remove (e.g., ["INBOX"])
+
+    Returns:
+        Number of distinct threads modified
     """
     if not thread_ids:
-        return
+        return 0
 
-    logger.info(
-        f"Modifying labels on {len(thread_ids)} threads",
+    logger.debug(
+        "Modifying thread labels",
         add_labels=add_label_ids,
         remove_labels=remove_label_ids,
     )
 
-    for thread_id in thread_ids:
-        body = {}
-        if add_label_ids:
-            body["addLabelIds"] = add_label_ids
-        if remove_label_ids:
-            body["removeLabelIds"] = remove_label_ids
+    body = {}
+    if add_label_ids:
+        body["addLabelIds"] = add_label_ids
+    if remove_label_ids:
+        body["removeLabelIds"] = remove_label_ids
 
-        _retry_on_rate_limit(
-            lambda tid=thread_id, b=body: service.users()
-            .threads()
-            .modify(userId="me", id=tid, body=b)
-            .execute()
-        )
-        logger.debug(f"Modified thread {thread_id}")
+    return _batch_execute(
+        service,
+        thread_ids,
+        lambda svc, tid: svc.users().threads().modify(userId="me", id=tid, body=body),
+    )
+
+
+def _batch_execute(
+    service,
+    ids: list[str],
+    build_request,
+    chunk_size: int = 50,
+    units_per_request: int = 10,
+) -> int:
+    """Run one request per ID as batch HTTP requests, ignoring responses.
+
+    Only for idempotent requests: a chunk that hits a rate limit is re-sent
+    whole.
+
+    Args:
+        service: Gmail API service instance
+        ids: IDs to process (duplicates are dropped; batch IDs must be unique)
+        build_request: Callable(service, id) -> request object
+        chunk_size: Requests per batch (Gmail recommends at most 50)
+        units_per_request: Quota cost of each request, for pacing
+
+    Returns:
+        Number of distinct IDs processed
+    """
+    ids = list(dict.fromkeys(ids))
+
+    def execute_chunk(chunk: list[str]) -> None:
+        _gmail_quota.consume(units_per_request * len(chunk))
+        batch = service.new_batch_http_request(callback=_raise_on_error)
+        for item_id in chunk:
+            batch.add(build_request(service, item_id), request_id=item_id)
+        batch.execute()
+
+    for i in range(0, len(ids), chunk_size):
+        chunk = ids[i : i + chunk_size]
+        _retry_on_rate_limit(lambda c=chunk: execute_chunk(c))
+        logger.debug(f"Processed {i + len(chunk)}/{len(ids)}", chunk_size=len(chunk))
+    return len(ids)
+
+
+# Batches in flight at once for multi-batch fetches. Overall throughput is
+# paced by _gmail_quota; rate limits are still retried per batch.
+_FETCH_WORKERS = 4
+
+
+@functools.cache
+def _fetch_pool() -> ThreadPoolExecutor:
+    """Thread pool for concurrent batch fetches, shared for the process.
+
+    Reusing the same workers means the per-thread services (and their
+    connections) they build via get_gmail() serve every later fetch too,
+    instead of being discarded with a per-call pool.
+    """
+    return ThreadPoolExecutor(
+        max_workers=_FETCH_WORKERS, thread_name_prefix="gmail-fetch"
+    )
 
 
 def _batch_fetch(
-    service, items: list[dict], build_request, chunk_size: int = 15
+    service,
+    items: list[dict],
+    build_request,
+    chunk_size: int = 15,
+    units_per_item: int = 5,
+    errors: dict | None = None,
 ) -> dict:
     """Batch fetch full details for a list of items.
 
+    When there is more than one batch, batches run concurrently on a shared
+    thread pool (see _fetch_pool). httplib2 is not thread-safe, so each
+    worker uses its own per-thread service from get_gmail() rather than the
+    one passed in.
+
     Args:
-        service: Gmail API service instance
+        service: Gmail API service instance. Only used when everything fits
+            in a single batch; multi-batch fetches use per-worker services.
         items: List of dicts with 'id' keys (from list API response)
         build_request: Callable(service, item_id) -> request object
         chunk_size: Items per batch (15 for messages, 10 for threads)
+        units_per_item: Quota cost of each request, for pacing
+        errors: If given, collects non-retryable per-item failures by ID
+            instead of raising (see _batch_callback)
 
     Returns:
         Dict mapping item ID to full response
     """
     responses = {}
-    for i in range(0, len(items), chunk_size):
-        chunk = items[i : i + chunk_size]
-        batch = service.new_batch_http_request(callback=_batch_callback(responses))
+
+    def execute_chunk(svc, chunk: list[dict]) -> None:
+        _gmail_quota.consume(units_per_item * len(chunk))
+        batch = svc.new_batch_http_request(callback=_batch_callback(responses, errors))
         for item in chunk:
-            batch.add(build_request(service, item["id"]), request_id=item["id"])
+            batch.add(build_request(svc, item["id"]), request_id=item["id"])
         batch.execute()
-        if i + chunk_size < len(items):
-            time.sleep(0.3)
+
+    chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+    if len(chunks) <= 1:
+        for chunk in chunks:
+            _retry_on_rate_limit(lambda c=chunk: execute_chunk(service, c))
+        return responses
+
+    def worker(chunk: list[dict]) -> None:
+        svc = get_gmail()
+        _retry_on_rate_limit(lambda: execute_chunk(svc, chunk))
+
+    # Consume results so the first worker exception propagates
+    list(_fetch_pool().map(worker, chunks))
     return responses
 
 
@@ -494,36 +798,92 @@ def _get_headers(msg: dict) -> dict[str, str]:
     return {h["name"].lower(): h["value"] for h in msg["payload"]["headers"]}
 
 
-def _strip_html(html: str) -> str:
-    """Strip HTML tags for basic text extraction."""
-    import re
+# Headers shown in message/thread/draft summaries
+_SUMMARY_HEADERS = frozenset({"from", "to", "cc", "bcc", "subject", "date"})
+
 
+def _get_summary_headers(msg: dict) -> dict[str, str]:
+    """Like _get_headers, but only the headers summaries display.
+
+    Messages often carry dozens of Received/DKIM/ARC headers; only
+    _SUMMARY_HEADERS are kept. As in _get_headers, the last occurrence of a
+    repeated header wins.
+    """
+    headers: dict[str, str] = {}
+    for h in msg["payload"]["headers"]:
+        name = h["name"].lower()
+        if name in _SUMMARY_HEADERS:
+            headers[name] = h["value"]
+    return headers
+
+
+_SCRIPT_STYLE_PATTERN = re.compile(
+    r"<(script|style)[^>]*>.*?</\1>", flags=re.DOTALL | re.IGNORECASE
+)
+_BLOCK_TAG_PATTERN = re.compile(r"<(br|p|div|tr|li)[^>]*>", flags=re.IGNORECASE)
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+_BLANK_LINES_PATTERN = re.compile(r"\n\s*\n+")
+
+
+def _strip_html(html_text: str) -> str:
+    """Strip HTML tags for basic text extraction."""
     # Remove script and style elements
-    html = re.sub(
-        r"<(script|style)[^>]*>.*?</\1>", "", html, flags=re.DOTALL | re.IGNORECASE
-    )
+    text = _SCRIPT_STYLE_PATTERN.sub("", html_text)
     # Replace common block elements with newlines
-    html = re.sub(r"<(br|p|div|tr|li)[^>]*>", "\n", html, flags=re.IGNORECASE)
+    text = _BLOCK_TAG_PATTERN.sub("\n", text)
     # Remove remaining tags
-    html = re.sub(r"<[^>]+>", "", html)
-    # Decode common HTML entities
-    html = (
-        html.replace("&nbsp;", " ")
-        .replace("&amp;", "&")
-        .replace("&lt;", "<")
-        .replace("&gt;", ">")
-        .replace("&quot;", '"')
-    )
+    text = _TAG_PATTERN.sub("", text)
+    # Decode all HTML entities (named and numeric, e.g. &#39; and &rsquo;),
+    # keeping non-breaking spaces as plain spaces
+    text = html.unescape(text).replace("\xa0", " ")
     # Collapse multiple newlines
-    html = re.sub(r"\n\s*\n+", "\n\n", html)
-    return html.strip()
+    text = _BLANK_LINES_PATTERN.sub("\n\n", text)
+    return text.strip()
+
+
+def _decode_base64url(data: str) -> bytes:
+    """Decode Gmail's URL-safe base64 (bodies, attachments, inline images).
+
+    Decoding is non-validating (the stdlib default), since the data comes from
+    Google's servers. Missing padding is restored with a length check instead
+    of letting binascii reject the input.
+    """
+    if pad := -len(data) % 4:
+        data += "=" * pad
+    return base64.urlsafe_b64decode(data)
+
+
+# Base64 characters decoded per write; a multiple of 4 so only the final
+# chunk can need padding
+_DECODE_CHUNK_CHARS = 4 * 1024 * 1024
+
+
+def _write_base64url(path: Path, data: str) -> int:
+    """Decode Gmail's URL-safe base64 straight to a file, returning bytes written.
+
+    Decodes in chunks so a large attachment never holds the full decoded bytes
+    in memory alongside the encoded string. Like write_cache_file, writes to a
+    temporary sibling and renames it into place, so a decode error partway
+    through never leaves a truncated file at ``path``.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    written = 0
+    try:
+        with tmp_path.open("wb") as f:
+            for start in range(0, len(data), _DECODE_CHUNK_CHARS):
+                written += f.write(
+                    _decode_base64url(data[start : start + _DECODE_CHUNK_CHARS])
+                )
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return written
 
 
 def _decode_part(part: dict) -> str:
     """Decode base64 body data from a MIME part."""
-    return base64.urlsafe_b64decode(part["body"]["data"]).decode(
-        "utf-8", errors="replace"
-    )
+    return _decode_base64url(part["body"]["data"]).decode("utf-8", errors="replace")
 
 
 def _find_body_parts(payload: dict) -> tuple[dict | None, dict | None]:
@@ -534,12 +894,12 @@ def _find_body_parts(payload: dict) -> tuple[dict | None, dict | None]:
     text_part: dict | None = None
     html_part: dict | None = None
 
-    def traverse(part: dict) -> bool:
-        """Traverse MIME tree. Returns True to stop (found both)."""
-        nonlocal text_part, html_part
-        mime = part.get("mimeType", "")
-
+    # Depth-first, in document order: the first matching part wins
+    stack = [payload]
+    while stack:
+        part = stack.pop()
         if part.get("body", {}).get("data"):
+            mime = part.get("mimeType", "")
             # Treat missing/empty mimeType as text/plain (simple emails without parts)
             if mime in ("text/plain", "") and text_part is None:
                 text_part = part
@@ -547,14 +907,11 @@ def _find_body_parts(payload: dict) -> tuple[dict | None, dict | None]:
                 html_part = part
 
             if text_part is not None and html_part is not None:
-                return True
+                break
 
-        for subpart in part.get("parts", []):
-            if traverse(subpart):
-                return True
-        return False
+        if subparts := part.get("parts"):
+            stack.extend(reversed(subparts))
 
-    traverse(payload)
     return text_part, html_part
 
 
@@ -604,6 +961,13 @@ def _sanitize_id(id_: str) -> str:
     return id_.replace("/", "_").replace("..", "__")
 
 
+@functools.cache
+def _ensure_dir(path: Path) -> Path:
+    """Create a cache directory once per process, not once per file written."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 def _write_email_cache(
     prefix: str, id_: str, summary: dict, body: str, html_body: str | None
 ) -> str:
@@ -616,14 +980,14 @@ def _write_email_cache(
 
     The JSON includes body_file and html_file paths for reference.
     """
-    EMAIL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(EMAIL_CACHE_DIR)
 
     base_name = f"{prefix}-{_sanitize_id(id_)}"
     json_path = EMAIL_CACHE_DIR / f"{base_name}.json"
     txt_path = EMAIL_CACHE_DIR / f"{base_name}.txt"
 
     # Write plain text body
-    txt_path.write_text(body, encoding="utf-8")
+    write_cache_file(txt_path, body)
 
     # Build metadata (without snippet, without inline body)
     file_data = {k: v for k, v in summary.items() if k != "snippet"}
@@ -632,10 +996,10 @@ def _write_email_cache(
     # Write HTML body if present
     if html_body:
         html_path = EMAIL_CACHE_DIR / f"{base_name}.html"
-        html_path.write_text(html_body, encoding="utf-8")
+        write_cache_file(html_path, html_body)
         file_data["html_file"] = str(html_path)
 
-    json_path.write_text(json.dumps(file_data, indent=2), encoding="utf-8")
+    write_cache_file(json_path, json.dumps(file_data, indent=2))
     return str(json_path)
 
 
@@ -648,7 +1012,7 @@ def extract_message_summary(msg: dict, include_headers: bool = False) -> dict:
         msg: Gmail API message object
         include_headers: If True, include all email headers in the output
     """
-    headers = _get_headers(msg)
+    headers = _get_summary_headers(msg)
     result = {
         "id": msg["id"],
         "threadId": msg["threadId"],
@@ -679,9 +1043,9 @@ def _write_thread_metadata(thread_id: str, metadata: dict) -> str:
     Thread files contain metadata about the conversation (message IDs, counts,
     labels) but NOT message bodies. Use `gmail message` to fetch bodies.
     """
-    EMAIL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(EMAIL_CACHE_DIR)
     json_path = EMAIL_CACHE_DIR / f"thread-{_sanitize_id(thread_id)}.json"
-    json_path.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+    write_cache_file(json_path, json.dumps(metadata, indent=2))
     return str(json_path)
 
 
@@ -698,21 +1062,16 @@ def extract_thread_summary(thread: dict) -> dict:
         result["file"] = _write_thread_metadata(thread["id"], result)
         return result
 
-    # Get the latest message for display
-    latest_msg = messages[-1]
-    headers = _get_headers(latest_msg)
-
     # Aggregate labels and build message summaries (oldest to newest)
-    all_labels = set()
+    all_labels = set().union(*(msg.get("labelIds", ()) for msg in messages))
+    headers_by_msg = [_get_summary_headers(msg) for msg in messages]
     unread_count = 0
     message_summaries = []
-    for msg in messages:
+    for msg, msg_headers in zip(messages, headers_by_msg):
         labels = msg.get("labelIds", [])
-        all_labels.update(labels)
         is_unread = "UNREAD" in labels
         if is_unread:
             unread_count += 1
-        msg_headers = _get_headers(msg)
         msg_summary = {
             "id": msg["id"],
             "date": _convert_to_local_time(msg_headers.get("date", "")),
@@ -727,6 +1086,10 @@ def extract_thread_summary(thread: dict) -> dict:
             msg_summary["bcc"] = bcc
         message_summaries.append(msg_summary)
 
+    # Use latest message for display
+    latest_msg = messages[-1]
+    headers = headers_by_msg[-1]
+
     result = {
         "threadId": thread["id"],
         "messageCount": len(messages),
@@ -751,7 +1114,7 @@ def extract_thread_summary(thread: dict) -> dict:
 def extract_draft_summary(draft: dict) -> dict:
     """Extract essential fields from a draft for compact output."""
     msg = draft["message"]
-    headers = _get_headers(msg)
+    headers = _get_summary_headers(msg)
     result = {
         "id": draft["id"],
         "messageId": msg["id"],
@@ -864,18 +1227,24 @@ def message(message_ids: tuple[str, ...], headers: bool):
         jean-claude gmail message --headers 19b51f93fcf3f8ca
     """
     service = get_gmail()
-    summaries = []
-    unread_thread_ids = set()
-    for message_id in message_ids:
-        msg = (
-            service.users()
-            .messages()
-            .get(userId="me", id=message_id, format="full")
-            .execute()
-        )
-        summaries.append(extract_message_summary(msg, include_headers=headers))
-        if "UNREAD" in msg.get("labelIds", []):
-            unread_thread_ids.add(msg["threadId"])
+    # Batch request IDs must be unique; output still follows the given order
+    unique_ids = list(dict.fromkeys(message_ids))
+    responses = _batch_fetch(
+        service,
+        [{"id": mid} for mid in unique_ids],
+        lambda svc, mid: svc.users().messages().get(userId="me", id=mid, format="full"),
+        chunk_size=15,
+    )
+    by_id = {
+        mid: extract_message_summary(responses[mid], include_headers=headers)
+        for mid in unique_ids
+    }
+    summaries = [by_id[mid] for mid in message_ids]
+    unread_thread_ids = {
+        msg["threadId"]
+        for msg in responses.values()
+        if "UNREAD" in msg.get("labelIds", [])
+    }
     click.echo(json.dumps(summaries, indent=2))
 
     # Hint to mark as read after viewing full content
@@ -903,16 +1272,17 @@ def thread(thread_ids: tuple[str, ...], headers: bool):
         jean-claude gmail thread id1 id2 id3
     """
     service = get_gmail()
+    responses = _batch_fetch(
+        service,
+        [{"id": tid} for tid in dict.fromkeys(thread_ids)],
+        lambda svc, tid: svc.users().threads().get(userId="me", id=tid, format="full"),
+        chunk_size=10,
+        units_per_item=10,
+    )
     summaries = []
     unread_thread_ids = set()
     for thread_id in thread_ids:
-        thread_data = (
-            service.users()
-            .threads()
-            .get(userId="me", id=thread_id, format="full")
-            .execute()
-        )
-        for msg in thread_data.get("messages", []):
+        for msg in responses[thread_id].get("messages", []):
             summaries.append(extract_message_summary(msg, include_headers=headers))
             if "UNREAD" in msg.get("labelIds", []):
                 unread_thread_ids.add(msg["threadId"])
@@ -942,7 +1312,7 @@ def _search_messages(query: str, max_results: int, page_token: str | None = None
         )
         return
 
-    # Batch fetch messages (15/chunk × 5 units = 75 units, 0.3s delay)
+    # Batch fetch messages (15/chunk × 5 units = 75 units)
     responses = _batch_fetch(
         service,
         messages,
@@ -1018,6 +1388,7 @@ def _search_threads(
         threads,
         lambda svc, tid: svc.users().threads().get(userId="me", id=tid, format="full"),
         chunk_size=10,
+        units_per_item=10,
     )
     detailed = [
         extract_thread_summary(responses[t["id"]])
@@ -1106,6 +1477,7 @@ def draft_send(draft_id: str):
     )
 
 
+@functools.lru_cache(maxsize=256)
 def _format_gmail_date(date_str: str) -> str:
     """Format date string to Gmail's reply format: 'Mon, 22 Dec 2025 at 02:50'."""
     dt = parsedate_to_datetime(date_str)
@@ -1243,6 +1615,19 @@ Subject: {safe_subject}<br><br>
 </div>"""
 
 
+# Headers a reply needs when the original's body isn't quoted
+_REPLY_HEADERS = [
+    "From",
+    "To",
+    "Cc",
+    "Reply-To",
+    "Subject",
+    "Date",
+    "Message-ID",
+    "References",
+]
+
+
 def _create_reply_draft(
     message_id: str,
     body: str,
@@ -1250,6 +1635,7 @@ def _create_reply_draft(
     include_cc: bool,
     custom_cc: str | None = None,
     attachments: list[Path] | None = None,
+    quote: bool = True,
 ) -> tuple[str, str]:
     """Create a reply draft, returning (draft_id, draft_url).
 
@@ -1259,13 +1645,18 @@ def _create_reply_draft(
         include_cc: If True, include CC recipients (reply-all behavior)
         custom_cc: Optional user-specified CC addresses (overrides auto-CC)
         attachments: Optional list of file paths to attach
+        quote: If False, skip the quoted original and fetch only its headers
     """
     service = get_gmail()
-    # Use format="full" to get the message body for quoting
+    if quote:
+        # Use format="full" to get the message body for quoting
+        get_kwargs = {"format": "full"}
+    else:
+        get_kwargs = {"format": "metadata", "metadataHeaders": _REPLY_HEADERS}
     original = (
         service.users()
         .messages()
-        .get(userId="me", id=message_id, format="full")
+        .get(userId="me", id=message_id, **get_kwargs)
         .execute()
     )
     my_from_addr = get_my_from_address(service)
@@ -1283,9 +1674,6 @@ def _create_reply_draft(
     message_id_header = headers.get("message-id", "")
     orig_refs = headers.get("references", "")
 
-    # Get original body for quoting (both plain text and HTML)
-    original_body, original_html = extract_body(original["payload"])
-
     # Use SENT label to detect own messages (handles send-as aliases)
     labels = original.get("labelIds", [])
     is_own_message = "SENT" in labels
@@ -1337,16 +1725,19 @@ def _create_reply_draft(
     if not subject.lower().startswith("re:"):
         subject = f"Re: {subject}"
 
-    # Build both plain text and HTML versions
-    plain_body = _build_quoted_reply(body, original_body, from_addr, date)
-    html_body = _build_html_quoted_reply(
-        body, original_html, original_body, from_addr, date
-    )
-
-    # Auto-include inline images from original (they're part of the quoted body)
-    inline_image_parts, _ = _fetch_inline_image_parts(
-        service, message_id, original["payload"], html_body
-    )
+    if quote:
+        # Build both plain text and HTML versions, quoting the original
+        original_body, original_html = extract_body(original["payload"])
+        plain_body = _build_quoted_reply(body, original_body, from_addr, date)
+        html_body = _build_html_quoted_reply(
+            body, original_html, original_body, from_addr, date
+        )
+        # Auto-include inline images from original (they're part of the quote)
+        inline_image_parts, _ = _fetch_inline_image_parts(
+            service, message_id, original["payload"], html_body
+        )
+    else:
+        plain_body, html_body, inline_image_parts = body, None, []
 
     # Build message with attachments and inline images
     msg = _build_message_with_attachments(
@@ -1391,11 +1782,18 @@ def _create_reply_draft(
     type=click.Path(exists=True, dir_okay=False, path_type=Path),
     help="File to attach (can be repeated)",
 )
-def draft_reply(message_id: str, cc: str | None, attachments: tuple[Path, ...]):
+@click.option(
+    "--no-quote",
+    is_flag=True,
+    help="Don't quote the original message (fetches only its headers)",
+)
+def draft_reply(
+    message_id: str, cc: str | None, attachments: tuple[Path, ...], no_quote: bool
+):
     """Create a reply draft with body from stdin.
 
     Preserves threading with the original message. Includes quoted original
-    message in Gmail format.
+    message in Gmail format unless --no-quote is given.
 
     MESSAGE_ID: The message to reply to.
 
@@ -1405,11 +1803,17 @@ def draft_reply(message_id: str, cc: str | None, attachments: tuple[Path, ...]):
     Examples:
         echo "Thanks!" | jean-claude gmail draft reply MSG_ID
         echo "See attached" | jean-claude gmail draft reply MSG_ID --attach response.pdf
+        echo "Done" | jean-claude gmail draft reply MSG_ID --no-quote
     """
     body = read_body_stdin()
 
     draft_id, url = _create_reply_draft(
-        message_id, body, include_cc=False, custom_cc=cc, attachments=list(attachments)
+        message_id,
+        body,
+        include_cc=False,
+        custom_cc=cc,
+        attachments=list(attachments),
+        quote=not no_quote,
     )
     logger.info(f"Reply draft created: {draft_id}", url=url)
     click.echo(json.dumps({"id": draft_id, "url": url}, indent=2))
@@ -1425,11 +1829,18 @@ def draft_reply(message_id: str, cc: str | None, attachments: tuple[Path, ...]):
     type=click.Path(exists=True, dir_okay=False, path_type=Path),
     help="File to attach (can be repeated)",
 )
-def draft_reply_all(message_id: str, cc: str | None, attachments: tuple[Path, ...]):
+@click.option(
+    "--no-quote",
+    is_flag=True,
+    help="Don't quote the original message (fetches only its headers)",
+)
+def draft_reply_all(
+    message_id: str, cc: str | None, attachments: tuple[Path, ...], no_quote: bool
+):
     """Create a reply-all draft with body from stdin.
 
     Preserves threading and includes all original recipients. Includes quoted
-    original message in Gmail format.
+    original message in Gmail format unless --no-quote is given.
 
     MESSAGE_ID: The message to reply to.
 
@@ -1439,11 +1850,17 @@ def draft_reply_all(message_id: str, cc: str | None, attachments: tuple[Path, ..
     Examples:
         echo "Thanks everyone!" | jean-claude gmail draft reply-all MSG_ID
         echo "See attached" | jean-claude gmail draft reply-all MSG_ID --attach notes.pdf
+        echo "Done" | jean-claude gmail draft reply-all MSG_ID --no-quote
     """
     body = read_body_stdin()
 
     draft_id, url = _create_reply_draft(
-        message_id, body, include_cc=True, custom_cc=cc, attachments=list(attachments)
+        message_id,
+        body,
+        include_cc=True,
+        custom_cc=cc,
+        attachments=list(attachments),
+        quote=not no_quote,
     )
     logger.info(f"Reply-all draft created: {draft_id}", url=url)
     click.echo(json.dumps({"id": draft_id, "url": url}, indent=2))
@@ -1510,30 +1927,43 @@ def draft_forward(
     )
 
     # Auto-include inline images (they're part of the message body display)
-    inline_image_parts, inline_attachment_ids = _fetch_inline_image_parts(
-        service, message_id, original["payload"], html_body
+    inline_images = (
+        extract_inline_images_from_payload(original["payload"])
+        if "cid:" in html_body
+        else []
+    )
+    inline_ids = {img["attachmentId"] for img in inline_images}
+    # Original attachments, skipping those included as inline images
+    orig_attachments = [
+        att
+        for att in extract_attachments_from_payload(original["payload"])
+        if att["attachmentId"] not in inline_ids
+    ]
+
+    # Fetch inline images and attachments in one batch. A failed image is
+    # skipped, but every original attachment must be forwarded.
+    errors: dict[str, Exception] = {}
+    attachment_data = _fetch_attachment_data(
+        service, message_id, inline_images + orig_attachments, errors=errors
+    )
+    inline_image_parts, _ = _build_inline_image_parts(
+        inline_images, attachment_data, errors
     )
 
-    # Collect regular attachments (new files + original if requested)
+    # Collect regular attachments (new files + originals)
     all_attachment_parts: list[MIMEBase] = []
 
     # Add new file attachments
     for file_path in attachments:
         all_attachment_parts.append(_create_attachment_part(file_path))
 
-    # Add original attachments (skip those already included as inline images)
-    orig_attachments = extract_attachments_from_payload(original["payload"])
     for att in orig_attachments:
-        if att["attachmentId"] in inline_attachment_ids:
-            continue
-        data = (
-            service.users()
-            .messages()
-            .attachments()
-            .get(userId="me", messageId=message_id, id=att["attachmentId"])
-            .execute()
-        )
-        decoded_data = base64.urlsafe_b64decode(data["data"])
+        decoded_data = attachment_data.get(att["attachmentId"])
+        if decoded_data is None:
+            raise JeanClaudeError(
+                f"Failed to fetch attachment {att['filename']}: "
+                f"{errors.get(att['attachmentId'])}"
+            )
 
         mime_type = att.get("mimeType", "application/octet-stream")
         if "/" in mime_type:
@@ -1662,15 +2092,15 @@ def draft_get(draft_id: str):
         service.users().drafts().get(userId="me", id=draft_id, format="full").execute()
     )
     msg = draft["message"]
-    headers = _get_headers(msg)
+    headers = _get_summary_headers(msg)
     body = decode_body(msg["payload"])
 
-    DRAFT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(DRAFT_CACHE_DIR)
 
     # Write body to plain text file (sanitize ID for safe filenames)
     safe_id = _sanitize_id(draft_id)
     body_path = DRAFT_CACHE_DIR / f"draft-{safe_id}.txt"
-    body_path.write_text(body, encoding="utf-8")
+    write_cache_file(body_path, body)
 
     # Build metadata JSON (without inline body)
     draft_data = {
@@ -1695,11 +2125,22 @@ def draft_get(draft_id: str):
         ]
 
     json_path = DRAFT_CACHE_DIR / f"draft-{safe_id}.json"
-    json_path.write_text(json.dumps(draft_data, indent=2), encoding="utf-8")
+    write_cache_file(json_path, json.dumps(draft_data, indent=2))
 
     click.echo(json.dumps({"id": draft_id, "file": str(json_path)}, indent=2))
 
 
+# Headers carried over when a draft is rebuilt: (lowercase source, output name)
+_DRAFT_HEADER_COPY = (
+    ("to", "to"),
+    ("cc", "cc"),
+    ("bcc", "bcc"),
+    ("subject", "subject"),
+    ("in-reply-to", "In-Reply-To"),
+    ("references", "References"),
+)
+
+
 @draft.command("update")
 @click.argument("draft_id")
 @click.option("--to", "to_addr", help="Update To recipients (comma-separated)")
@@ -1814,19 +2255,11 @@ def draft_update(
     else:
         # No --attach provided - preserve existing attachments from draft
         existing_attachments = extract_attachments_from_payload(existing_msg["payload"])
+        attachment_data = _fetch_attachment_data(
+            service, existing_msg["id"], existing_attachments
+        )
         for att in existing_attachments:
-            data = (
-                service.users()
-                .messages()
-                .attachments()
-                .get(
-                    userId="me",
-                    messageId=existing_msg["id"],
-                    id=att["attachmentId"],
-                )
-                .execute()
-            )
-            decoded_data = base64.urlsafe_b64decode(data["data"])
+            decoded_data = attachment_data[att["attachmentId"]]
 
             mime_type = att.get("mimeType", "application/octet-stream")
             if "/" in mime_type:
@@ -1854,13 +2287,9 @@ def draft_update(
         msg = body_part
     # Preserve original From header
     msg["from"] = headers.get("from") or get_my_from_address(service)
-    for field in ["to", "cc", "bcc", "subject"]:
-        if value := headers.get(field):
-            msg[field] = value
-    if in_reply_to := headers.get("in-reply-to"):
-        msg["In-Reply-To"] = in_reply_to
-    if references := headers.get("references"):
-        msg["References"] = references
+    for source, target in _DRAFT_HEADER_COPY:
+        if value := headers.get(source):
+            msg[target] = value
 
     raw = base64.urlsafe_b64encode(msg.as_bytes()).decode()
     api_body = {"message": {"raw": raw}}
@@ -1942,13 +2371,25 @@ def archive(thread_ids: tuple[str, ...], query: str | None, max_results: int):
 
     if query:
         full_query = f"in:inbox {query}"
-        results = (
-            service.users()
-            .threads()
-            .list(userId="me", q=full_query, maxResults=max_results)
-            .execute()
-        )
-        ids = [t["id"] for t in results["threads"]] if "threads" in results else []
+        ids = []
+        page_token = None
+        # Collect every page before archiving: archiving removes threads from
+        # in:inbox, which would shift later pages of the same query
+        while len(ids) < max_results:
+            list_kwargs = {
+                "userId": "me",
+                "q": full_query,
+                "maxResults": min(500, max_results - len(ids)),
+                # Only thread IDs are needed; skip snippets and history IDs
+                "fields": "threads/id,nextPageToken",
+            }
+            if page_token:
+                list_kwargs["pageToken"] = page_token
+            results = service.users().threads().list(**list_kwargs).execute()
+            ids.extend(t["id"] for t in results.get("threads", []))
+            page_token = results.get("nextPageToken")
+            if not page_token:
+                break
     else:
         ids = list(thread_ids)
 
@@ -1956,8 +2397,8 @@ def archive(thread_ids: tuple[str, ...], query: str | None, max_results: int):
         logger.info("No threads to archive")
         return
 
-    _modify_thread_labels(service, ids, remove_label_ids=["INBOX"])
-    logger.info(f"Archived {len(ids)} threads", count=len(ids))
+    n = _modify_thread_labels(service, ids, remove_label_ids=["INBOX"])
+    logger.info(f"Archived {n} threads", count=n)
 
 
 @cli.command()
@@ -1969,8 +2410,8 @@ def unarchive(thread_ids: tuple[str, ...]):
     if not ids:
         logger.info("No threads to unarchive")
         return
-    _modify_thread_labels(service, ids, add_label_ids=["INBOX"])
-    logger.info(f"Moved {len(ids)} threads to inbox", count=len(ids))
+    n = _modify_thread_labels(service, ids, add_label_ids=["INBOX"])
+    logger.info(f"Moved {n} threads to inbox", count=n)
 
 
 @cli.command("mark-read")
@@ -1978,9 +2419,8 @@ def unarchive(thread_ids: tuple[str, ...]):
 def mark_read(thread_ids: tuple[str, ...]):
     """Mark threads as read (all messages in thread)."""
     service = get_gmail()
-    ids = list(thread_ids)
-    _modify_thread_labels(service, ids, remove_label_ids=["UNREAD"])
-    logger.info(f"Marked {len(ids)} threads read", count=len(ids))
+    n = _modify_thread_labels(service, list(thread_ids), remove_label_ids=["UNREAD"])
+    logger.info(f"Marked {n} threads read", count=n)
 
 
 @cli.command("mark-unread")
@@ -1988,9 +2428,8 @@ def mark_read(thread_ids: tuple[str, ...]):
 def mark_unread(thread_ids: tuple[str, ...]):
     """Mark threads as unread."""
     service = get_gmail()
-    ids = list(thread_ids)
-    _modify_thread_labels(service, ids, add_label_ids=["UNREAD"])
-    logger.info(f"Marked {len(ids)} threads unread", count=len(ids))
+    n = _modify_thread_labels(service, list(thread_ids), add_label_ids=["UNREAD"])
+    logger.info(f"Marked {n} threads unread", count=n)
 
 
 @cli.command()
@@ -1998,23 +2437,15 @@ def mark_unread(thread_ids: tuple[str, ...]):
 def trash(thread_ids: tuple[str, ...]):
     """Move threads to trash (all messages in thread)."""
     service = get_gmail()
-    ids = list(thread_ids)
 
-    # Use threads.trash API (5 units per thread)
-    chunk_size = 50
-    for i in range(0, len(ids), chunk_size):
-        chunk = ids[i : i + chunk_size]
-        batch = service.new_batch_http_request(callback=_raise_on_error)
-        for tid in chunk:
-            batch.add(
-                service.users().threads().trash(userId="me", id=tid),
-                request_id=tid,
-            )
-        batch.execute()
-        if i + chunk_size < len(ids):
-            time.sleep(0.3)
+    # Use threads.trash API (10 units per thread)
+    n = _batch_execute(
+        service,
+        list(thread_ids),
+        lambda svc, tid: svc.users().threads().trash(userId="me", id=tid),
+    )
 
-    logger.info(f"Trashed {len(ids)} threads", count=len(ids))
+    logger.info(f"Trashed {n} threads", count=n)
 
 
 @cli.command("modify-labels")
@@ -2044,10 +2475,9 @@ def modify_labels(
         raise click.UsageError("Provide at least one --add or --remove label")
 
     service = get_gmail()
-    ids = list(thread_ids)
-    _modify_thread_labels(
+    n = _modify_thread_labels(
         service,
-        ids,
+        list(thread_ids),
         add_label_ids=list(add_labels) or None,
         remove_label_ids=list(remove_labels) or None,
     )
@@ -2057,33 +2487,49 @@ def modify_labels(
     if remove_labels:
         parts.append(f"removed {', '.join(remove_labels)}")
     logger.info(
-        f"Modified {len(ids)} threads: {'; '.join(parts)}",
-        count=len(ids),
+        f"Modified {n} threads: {'; '.join(parts)}",
+        count=n,
         added=list(add_labels),
         removed=list(remove_labels),
     )
 
 
-def _extract_attachments(parts: list, attachments: list) -> None:
-    """Recursively extract attachment info from message parts."""
-    for part in parts:
+# Prefix for attachment IDs of parts whose data is inline in the message body
+# rather than stored separately (small files have no attachmentId).
+_INLINE_ATTACHMENT_PREFIX = "inline:"
+
+
+def _iter_attachments(parts: list) -> Iterator[dict]:
+    """Yield attachment info from message parts, including nested parts.
+
+    Small attachments may carry their data inline in ``body.data`` instead of
+    an attachmentId. These get a synthetic ``inline:<partId>`` ID, and the
+    data is kept under ``"data"`` when present so callers can skip the
+    attachments.get round trip.
+    """
+    # Depth-first, in document order
+    stack = list(reversed(parts))
+    while stack:
+        part = stack.pop()
         filename = part.get("filename", "")
         body = part.get("body", {})
         attachment_id = body.get("attachmentId")
+        data = body.get("data")
 
-        if filename and attachment_id:
-            attachments.append(
-                {
-                    "filename": filename,
-                    "mimeType": part.get("mimeType", "application/octet-stream"),
-                    "size": body.get("size", 0),
-                    "attachmentId": attachment_id,
-                }
-            )
+        if filename and (attachment_id or data or body.get("size")):
+            attachment = {
+                "filename": filename,
+                "mimeType": part.get("mimeType", "application/octet-stream"),
+                "size": body.get("size", 0),
+                "attachmentId": attachment_id
+                or f"{_INLINE_ATTACHMENT_PREFIX}{part.get('partId', '')}",
+            }
+            if data and not attachment_id:
+                attachment["data"] = data
+            yield attachment
 
-        # Recurse into nested parts
-        if "parts" in part:
-            _extract_attachments(part["parts"], attachments)
+        if subparts := part.get("parts"):
+            stack.extend(reversed(subparts))
 
 
 def extract_attachments_from_payload(payload: dict) -> list[dict]:
@@ -2094,15 +2540,42 @@ def extract_attachments_from_payload(payload: dict) -> list[dict]:
     2. Single-part messages where the payload itself is an attachment
        (e.g., DMARC reports sent as a raw zip file)
     """
-    attachments: list[dict] = []
+    if parts := payload.get("parts"):
+        return list(_iter_attachments(parts))
+    # Single-part message: only an attachment if the payload itself is named.
+    # Plain text/html bodies (most notifications) return without a walk.
+    if not payload.get("filename"):
+        return []
+    return list(_iter_attachments([payload]))
+
+
+def _attachment_fields(depth: int = 8) -> str:
+    """Build a partial-response mask covering only what attachment listing reads.
+
+    The fields syntax has no recursion, so nest explicitly. Parts nested more
+    than ``depth`` levels below the payload come back unfiltered (including
+    ``body.data``) rather than being dropped; the attachments command strips
+    that data before printing.
+    """
+    part = "partId,filename,mimeType,body(size,attachmentId)"
+    fields = f"{part},parts"
+    for _ in range(depth):
+        fields = f"{part},parts({fields})"
+    return f"payload({fields})"
 
-    if "parts" in payload:
-        _extract_attachments(payload["parts"], attachments)
-    else:
-        # Check if payload itself is an attachment (single-part message)
-        _extract_attachments([payload], attachments)
 
-    return attachments
+_ATTACHMENT_FIELDS = _attachment_fields()
+
+
+def _find_part(payload: dict, part_id: str) -> dict | None:
+    """Find the MIME part with the given partId."""
+    stack = [payload]
+    while stack:
+        part = stack.pop()
+        if part.get("partId", "") == part_id:
+            return part
+        stack.extend(part.get("parts", []))
+    return None
 
 
 def _get_part_header(part: dict, name: str) -> str | None:
@@ -2116,17 +2589,21 @@ def _get_part_header(part: dict, name: str) -> str | None:
 
 
 def _extract_inline_images(parts: list, inline_images: list) -> None:
-    """Recursively extract inline image info from message parts.
+    """Extract inline image info from message parts, including nested parts.
 
     Inline images have a Content-ID header and are referenced in HTML via cid: URLs.
     """
-    for part in parts:
-        content_id = _get_part_header(part, "Content-ID")
-        body = part.get("body", {})
-        attachment_id = body.get("attachmentId")
-
-        # Inline images have Content-ID and attachmentId (for fetching data)
-        if content_id and attachment_id:
+    # Depth-first, in document order
+    stack = list(reversed(parts))
+    while stack:
+        part = stack.pop()
+        attachment_id = part.get("body", {}).get("attachmentId")
+        # Inline images have Content-ID and attachmentId (for fetching data).
+        # Only scan headers for parts with an attachmentId; text bodies and
+        # multipart containers never qualify.
+        content_id = attachment_id and _get_part_header(part, "Content-ID")
+
+        if content_id:
             inline_images.append(
                 {
                     "contentId": content_id,
@@ -2135,9 +2612,8 @@ def _extract_inline_images(parts: list, inline_images: list) -> None:
                 }
             )
 
-        # Recurse into nested parts
-        if "parts" in part:
-            _extract_inline_images(part["parts"], inline_images)
+        if subparts := part.get("parts"):
+            stack.extend(reversed(subparts))
 
 
 def extract_inline_images_from_payload(payload: dict) -> list[dict]:
@@ -2160,6 +2636,50 @@ def extract_inline_images_from_payload(payload: dict) -> list[dict]:
     return inline_images
 
 
+def _fetch_attachment_data(
+    service,
+    message_id: str,
+    attachments: list[dict],
+    chunk_size: int = 50,
+    errors: dict | None = None,
+) -> dict[str, bytes]:
+    """Fetch and decode attachment data, batching the attachments.get calls.
+
+    Attachments whose data is already inline (see _iter_attachments) are
+    decoded without a request.
+
+    Args:
+        service: Gmail API service instance
+        message_id: Message the attachments belong to
+        attachments: Attachment dicts from extract_attachments_from_payload
+        chunk_size: Requests per batch
+        errors: If given, collects per-attachment failures instead of raising
+
+    Returns:
+        Dict mapping attachment ID to decoded bytes
+    """
+    result = {
+        att["attachmentId"]: _decode_base64url(att["data"])
+        for att in attachments
+        if "data" in att
+    }
+    # Batch request IDs must be unique
+    ids = list(dict.fromkeys(a["attachmentId"] for a in attachments if "data" not in a))
+    responses = _batch_fetch(
+        service,
+        [{"id": aid} for aid in ids],
+        lambda svc, aid: svc.users()
+        .messages()
+        .attachments()
+        .get(userId="me", messageId=message_id, id=aid),
+        chunk_size=chunk_size,
+        errors=errors,
+    )
+    for aid, response in responses.items():
+        result[aid] = _decode_base64url(response["data"])
+    return result
+
+
 def _fetch_inline_image_parts(
     service, message_id: str, payload: dict, html_body: str | None = None
 ) -> tuple[list[MIMEBase], set[str]]:
@@ -2169,56 +2689,75 @@ def _fetch_inline_image_parts(
     from the Gmail API. Returns MIMEBase parts with Content-ID preserved for use
     in multipart/related messages.
 
-    If html_body is provided, only fetches images that are actually referenced
-    via cid: URLs in the HTML. This avoids unnecessary API calls for unused images.
+    Inline images are only shown via cid: URLs in HTML, so nothing is fetched
+    (and the payload isn't walked) when html_body is None or has no cid: URLs.
 
     Returns:
         A tuple of (inline_image_parts, fetched_attachment_ids) where:
         - inline_image_parts: List of MIMEBase parts for inline images
         - fetched_attachment_ids: Set of attachment IDs that were fetched as inline
-          (used to avoid double-fetching original attachments in draft forward)
     """
-    # Short-circuit if HTML doesn't contain any cid: references
-    if html_body is not None and "cid:" not in html_body:
+    # Short-circuit if there's no HTML or it doesn't contain any cid: references
+    if html_body is None or "cid:" not in html_body:
         return [], set()
 
-    inline_image_parts: list[MIMEBase] = []
-    fetched_attachment_ids: set[str] = set()
     inline_images = extract_inline_images_from_payload(payload)
+    if not inline_images:
+        return [], set()
 
-    for img in inline_images:
-        try:
-            attachment_id = img["attachmentId"]
-            data = (
-                service.users()
-                .messages()
-                .attachments()
-                .get(userId="me", messageId=message_id, id=attachment_id)
-                .execute()
-            )
-            decoded_data = base64.urlsafe_b64decode(data["data"])
+    # Fetch all images in one batch; failed images are logged and skipped
+    # rather than breaking the draft
+    errors: dict[str, Exception] = {}
+    try:
+        data_by_id = _fetch_attachment_data(
+            service, message_id, inline_images, errors=errors
+        )
+    except Exception as e:
+        logger.warning("Failed to fetch inline images", error=str(e))
+        return [], set()
 
-            mime_type = img.get("mimeType", "application/octet-stream")
-            if "/" in mime_type:
-                main_type, sub_type = mime_type.split("/", 1)
-            else:
-                main_type, sub_type = "application", "octet-stream"
-            part = MIMEBase(main_type, sub_type)
-            part.set_payload(decoded_data)
-            encoders.encode_base64(part)
-            # Preserve Content-ID for cid: URL references in HTML
-            part.add_header("Content-ID", img["contentId"])
-            part.add_header("Content-Disposition", "inline")
-            inline_image_parts.append(part)
-            fetched_attachment_ids.add(attachment_id)
-        except Exception as e:
-            # Log and skip failed inline images rather than breaking the draft
+    return _build_inline_image_parts(inline_images, data_by_id, errors)
+
+
+def _build_inline_image_parts(
+    inline_images: list[dict], data_by_id: dict[str, bytes], errors: dict
+) -> tuple[list[MIMEBase], set[str]]:
+    """Build MIME parts for fetched inline images, skipping failed ones.
+
+    Args:
+        inline_images: Image dicts from extract_inline_images_from_payload
+        data_by_id: Decoded data by attachment ID (see _fetch_attachment_data)
+        errors: Fetch failures by attachment ID, for logging
+
+    Returns:
+        A tuple of (inline_image_parts, attachment IDs included as inline)
+    """
+    inline_image_parts: list[MIMEBase] = []
+    fetched_attachment_ids: set[str] = set()
+    for img in inline_images:
+        attachment_id = img["attachmentId"]
+        if attachment_id not in data_by_id:
             logger.warning(
                 "Failed to fetch inline image",
                 content_id=img.get("contentId"),
                 attachment_id=attachment_id,
-                error=str(e),
+                error=str(errors.get(attachment_id)),
             )
+            continue
+
+        mime_type = img.get("mimeType", "application/octet-stream")
+        if "/" in mime_type:
+            main_type, sub_type = mime_type.split("/", 1)
+        else:
+            main_type, sub_type = "application", "octet-stream"
+        part = MIMEBase(main_type, sub_type)
+        part.set_payload(data_by_id[attachment_id])
+        encoders.encode_base64(part)
+        # Preserve Content-ID for cid: URL references in HTML
+        part.add_header("Content-ID", img["contentId"])
+        part.add_header("Content-Disposition", "inline")
+        inline_image_parts.append(part)
+        fetched_attachment_ids.add(attachment_id)
 
     return inline_image_parts, fetched_attachment_ids
 
@@ -2479,12 +3018,15 @@ def attachments(message_id: str):
     msg = (
         service.users()
         .messages()
-        .get(userId="me", id=message_id, format="full")
+        .get(userId="me", id=message_id, format="full", fields=_ATTACHMENT_FIELDS)
         .execute()
     )
 
     payload = msg.get("payload", {})
     attachment_list = extract_attachments_from_payload(payload)
+    # Parts below the fields mask's depth arrive with their inline data
+    for attachment in attachment_list:
+        attachment.pop("data", None)
     click.echo(json.dumps(attachment_list, indent=2))
 
 
@@ -2515,23 +3057,36 @@ def attachment_download(
         jean-claude gmail attachment-download MSG_ID ATTACH_ID report.pdf -o ./
     """
     service = get_gmail()
-    attachment = (
-        service.users()
-        .messages()
-        .attachments()
-        .get(userId="me", messageId=message_id, id=attachment_id)
-        .execute()
-    )
+    if attachment_id.startswith(_INLINE_ATTACHMENT_PREFIX):
+        # Data is inline in the message itself; there is no attachment to fetch
+        msg = (
+            service.users()
+            .messages()
+            .get(userId="me", id=message_id, format="full")
+            .execute()
+        )
+        part_id = attachment_id.removeprefix(_INLINE_ATTACHMENT_PREFIX)
+        part = _find_part(msg.get("payload", {}), part_id)
+        if part is None or "data" not in part.get("body", {}):
+            raise JeanClaudeError(f"Attachment not found: {attachment_id}")
+        attachment = part["body"]
+    else:
+        attachment = (
+            service.users()
+            .messages()
+            .attachments()
+            .get(userId="me", messageId=message_id, id=attachment_id)
+            .execute()
+        )
 
     if output:
         output_dir = Path(output)
     else:
         output_dir = ATTACHMENT_CACHE_DIR
-    output_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(output_dir)
 
     output_path = output_dir / filename
-    data = base64.urlsafe_b64decode(attachment["data"])
-    output_path.write_bytes(data)
+    size = _write_base64url(output_path, attachment["data"])
 
-    result = {"file": str(output_path), "bytes": len(data)}
+    result = {"file": str(output_path), "bytes": size}
     click.echo(json.dumps(result, indent=2))
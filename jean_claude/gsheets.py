@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import re
 import sys
+import time
 from urllib.parse import unquote
 
 import click
@@ -13,9 +14,15 @@ from googleapiclient.errors import HttpError
 from .auth import build_service
 from .errors import ErrorHandlingGroup
 from .logging import JeanClaudeError, get_logger
+from .paths import SHEETS_META_CACHE_FILE, write_cache_file
 
 logger = get_logger(__name__)
 
+# Retries for idempotent requests on 429/5xx, using googleapiclient's built-in
+# exponential backoff. Not used for append: a retried append whose first
+# attempt actually landed would duplicate the rows.
+_NUM_RETRIES = 5
+
 
 class SheetsErrorHandlingGroup(ErrorHandlingGroup):
     """Error handling with Sheets-specific context for 404s."""
@@ -39,6 +46,74 @@ def get_sheets():
     return build_service("sheets", "v4")
 
 
+# How long a spreadsheet's first-sheet title is trusted before re-fetching.
+# Short, since tabs can be renamed or reordered from the web UI at any time.
+_FIRST_SHEET_CACHE_TTL = 5 * 60
+
+
+def _load_first_sheet_cache() -> dict:
+    try:
+        cache = json.loads(SHEETS_META_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_first_sheet_cache(cache: dict) -> None:
+    try:
+        SHEETS_META_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        write_cache_file(SHEETS_META_CACHE_FILE, json.dumps(cache))
+    except OSError as e:
+        logger.debug("Failed to write sheets metadata cache", error=str(e))
+
+
+def _forget_first_sheet(spreadsheet_id: str) -> None:
+    """Drop a spreadsheet's cached first-sheet title after its tabs change."""
+    cache = _load_first_sheet_cache()
+    if cache.pop(spreadsheet_id, None) is not None:
+        _save_first_sheet_cache(cache)
+
+
+def _first_sheet_title(service, spreadsheet_id: str) -> tuple[str, bool]:
+    """Get the title of a spreadsheet's first sheet.
+
+    Cached on disk briefly so repeated reads skip the metadata round trip.
+    add-sheet/delete-sheet and renames (which make the cached title fail to
+    parse) invalidate the entry, but a reorder done in the web UI is not
+    seen until it expires. Returns (title, from_cache).
+    """
+    cache = _load_first_sheet_cache()
+    entry = cache.get(spreadsheet_id)
+    if (
+        isinstance(entry, dict)
+        and isinstance(entry.get("title"), str)
+        and isinstance(entry.get("timestamp"), (int, float))
+        and time.time() - entry["timestamp"] < _FIRST_SHEET_CACHE_TTL
+    ):
+        return entry["title"], True
+
+    meta = (
+        service.spreadsheets()
+        .get(spreadsheetId=spreadsheet_id, fields="sheets.properties.title")
+        .execute(num_retries=_NUM_RETRIES)
+    )
+    if not meta.get("sheets"):
+        raise JeanClaudeError("Spreadsheet has no sheets")
+    title = meta["sheets"][0]["properties"]["title"]
+
+    now = time.time()
+    cache = {
+        id_: e
+        for id_, e in cache.items()
+        if isinstance(e, dict)
+        and isinstance(e.get("timestamp"), (int, float))
+        and now - e["timestamp"] < _FIRST_SHEET_CACHE_TTL
+    }
+    cache[spreadsheet_id] = {"title": title, "timestamp": now}
+    _save_first_sheet_cache(cache)
+    return title, False
+
+
 def _read_rows_from_stdin() -> list:
     """Read and validate JSON array of rows from stdin."""
     try:
@@ -81,49 +156,97 @@ def _normalize_range(range_str: str) -> str:
 @cli.command()
 @click.argument("spreadsheet_id")
 @click.option(
-    "--range", "range_", default="", help="A1 notation range (e.g., 'Sheet1!A1:D10')"
+    "--range",
+    "ranges",
+    multiple=True,
+    help="A1 range, e.g. 'Sheet1!A1:D10' (repeatable with --by-range)",
 )
 @click.option("--sheet", help="Sheet name (default: first sheet)")
-def read(spreadsheet_id: str, range_: str, sheet: str | None):
+@click.option(
+    "--by-range",
+    is_flag=True,
+    help='Output [{"range", "values"}, ...] for each --range, fetched in one request',
+)
+def read(
+    spreadsheet_id: str, ranges: tuple[str, ...], sheet: str | None, by_range: bool
+):
     """Read data from a spreadsheet. Returns JSON array of rows.
 
     SPREADSHEET_ID: The spreadsheet ID (from the URL)
 
+    Without --range or --sheet, reads the first sheet. Its name is cached for
+    five minutes, so if tabs are reordered in the web UI, a read in that
+    window may still return the previous first sheet; pass --sheet to be
+    exact.
+
+    With --by-range, every --range (one or more) is fetched in a single
+    request and the output is a JSON array of {"range", "values"} objects in
+    the order given, whatever the number of ranges.
+
     \b
     Examples:
         jean-claude gsheets read 1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms
         jean-claude gsheets read 1BxiM... --range 'Sheet1!A1:D10'
+        jean-claude gsheets read 1BxiM... --by-range --range 'Q1!A:D' --range 'Q2!A:D'
         jean-claude gsheets read 1BxiM... --sheet 'Data'
     """
+    if sheet and ranges:
+        raise click.UsageError("Provide --range or --sheet, not both")
+    if by_range and not ranges:
+        raise click.UsageError("--by-range requires at least one --range")
+    if len(ranges) > 1 and not by_range:
+        raise click.UsageError("Use --by-range to read more than one --range")
+
     service = get_sheets()
 
-    # Build the range
-    if range_:
-        full_range = _normalize_range(range_)
-    elif sheet:
-        full_range = sheet
-    else:
-        # Get first sheet name
-        meta = (
+    if by_range:
+        result = (
             service.spreadsheets()
-            .get(spreadsheetId=spreadsheet_id, fields="sheets.properties.title")
-            .execute()
+            .values()
+            .batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=[_normalize_range(r) for r in ranges],
+            )
+            .execute(num_retries=_NUM_RETRIES)
+        )
+        json.dump(
+            [
+                {"range": vr["range"], "values": vr.get("values", [])}
+                for vr in result.get("valueRanges", [])
+            ],
+            sys.stdout,
+            indent=2,
         )
-        if not meta["sheets"]:
-            raise JeanClaudeError("Spreadsheet has no sheets")
-        full_range = meta["sheets"][0]["properties"]["title"]
+        click.echo()
+        return
 
-    result = (
-        service.spreadsheets()
-        .values()
-        .get(
-            spreadsheetId=spreadsheet_id,
-            range=full_range,
+    def get_values(full_range: str) -> dict:
+        return (
+            service.spreadsheets()
+            .values()
+            .get(spreadsheetId=spreadsheet_id, range=full_range)
+            .execute(num_retries=_NUM_RETRIES)
         )
-        .execute()
-    )
 
-    click.echo(json.dumps(result.get("values", []), indent=2))
+    if ranges:
+        result = get_values(_normalize_range(ranges[0]))
+    elif sheet:
+        result = get_values(sheet)
+    else:
+        title, cached = _first_sheet_title(service, spreadsheet_id)
+        try:
+            result = get_values(title)
+        except HttpError as e:
+            # A renamed first sheet makes the cached title an unparseable range
+            if not cached or e.resp.status != 400:
+                raise
+            _forget_first_sheet(spreadsheet_id)
+            result = get_values(_first_sheet_title(service, spreadsheet_id)[0])
+
+    # Stream straight to stdout: large sheets would otherwise hold a second,
+    # fully serialized copy of every row in memory.
+    json.dump(result.get("values", []), sys.stdout, indent=2)
+    click.echo()
 
 
 @cli.command()
@@ -140,10 +263,11 @@ def info(spreadsheet_id: str):
             spreadsheetId=spreadsheet_id,
             fields="spreadsheetId,properties.title,sheets.properties",
         )
-        .execute()
+        .execute(num_retries=_NUM_RETRIES)
     )
 
-    click.echo(json.dumps(result, indent=2))
+    json.dump(result, sys.stdout, indent=2)
+    click.echo()
 
 
 @cli.command()
@@ -260,7 +384,7 @@ def write(spreadsheet_id: str, range_: str):
             valueInputOption="USER_ENTERED",
             body={"values": rows},
         )
-        .execute()
+        .execute(num_retries=_NUM_RETRIES)
     )
 
     logger.info(
@@ -305,7 +429,7 @@ def clear(spreadsheet_id: str, range_: str):
             range=normalized_range,
             body={},
         )
-        .execute()
+        .execute(num_retries=_NUM_RETRIES)
     )
 
     logger.info("Cleared range", range=result["clearedRange"])
@@ -342,6 +466,7 @@ def add_sheet(spreadsheet_id: str, sheet_name: str, index: int | None):
         .execute()
     )
 
+    _forget_first_sheet(spreadsheet_id)
     reply = result["replies"][0]["addSheet"]["properties"]
     logger.info("Added sheet", title=reply["title"], sheetId=reply["sheetId"])
     click.echo(
@@ -376,6 +501,7 @@ def delete_sheet(spreadsheet_id: str, sheet_name: str):
         body={"requests": [{"deleteSheet": {"sheetId": sheet_id}}]},
     ).execute()
 
+    _forget_first_sheet(spreadsheet_id)
     logger.info("Deleted sheet", title=sheet_name)
     click.echo(json.dumps({"deleted": sheet_name, "sheetId": sheet_id}))
 
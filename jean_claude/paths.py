@@ -8,6 +8,7 @@ Directory layout follows XDG Base Directory Specification:
 See: https://specifications.freedesktop.org/basedir-spec/latest/
 """
 
+import os
 from pathlib import Path
 
 # Base directories
@@ -29,3 +30,17 @@ EMAIL_CACHE_DIR = CACHE_DIR / "emails"
 DRAFT_CACHE_DIR = CACHE_DIR / "drafts"
 ATTACHMENT_CACHE_DIR = CACHE_DIR / "attachments"
 DRIVE_CACHE_DIR = CACHE_DIR / "drive"
+CONTACTS_CACHE_FILE = CACHE_DIR / "contacts.json"
+FROM_ADDRESS_CACHE_FILE = CACHE_DIR / "from_address.json"
+SHEETS_META_CACHE_FILE = CACHE_DIR / "sheets_meta.json"
+
+
+def write_cache_file(path: Path, text: str) -> None:
+    """Write a cache file atomically.
+
+    Writes to a temporary sibling and renames it into place, so readers (and
+    jq pipelines) never see a half-written file if the process is killed.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
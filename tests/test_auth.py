@@ -0,0 +1,104 @@
+"""Tests for shared Google API service construction."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from jean_claude import auth
+
+
+@pytest.fixture
+def fake_build(monkeypatch):
+    """Stub out credentials and discovery so build_service is offline."""
+    monkeypatch.setattr(auth, "_services", threading.local())
+    monkeypatch.setattr(auth, "get_credentials", lambda: object())
+    monkeypatch.setattr(
+        "google_auth_httplib2.AuthorizedHttp", lambda creds, http: object()
+    )
+    calls = []
+
+    def build(name, version, http):
+        calls.append((name, version))
+        return MagicMock(http=http)
+
+    monkeypatch.setattr("googleapiclient.discovery.build", build)
+    return calls
+
+
+def test_build_service_cached_within_thread(fake_build):
+    first = auth.build_service("gmail", "v1")
+    assert auth.build_service("gmail", "v1") is first
+    assert auth.build_service("people", "v1") is not first
+    assert fake_build == [("gmail", "v1"), ("people", "v1")]
+
+
+def test_build_service_not_shared_across_threads(fake_build):
+    main = auth.build_service("gmail", "v1")
+    other = []
+    t = threading.Thread(target=lambda: other.append(auth.build_service("gmail", "v1")))
+    t.start()
+    t.join()
+    assert other[0] is not main
+    assert len(fake_build) == 2
+
+
+def test_build_service_shares_transport_within_thread(fake_build):
+    gmail = auth.build_service("gmail", "v1")
+    people = auth.build_service("people", "v1")
+    assert gmail.http is people.http
+
+
+@pytest.fixture
+def fake_load(monkeypatch):
+    """Count credential loads from disk."""
+    monkeypatch.setattr(auth, "_credentials", None)
+    loads = []
+
+    def load():
+        creds = MagicMock(expired=False)
+        loads.append(creds)
+        return creds
+
+    monkeypatch.setattr(auth, "_load_credentials", load)
+    return loads
+
+
+def test_credentials_shared_across_threads(fake_load):
+    first = auth.get_credentials()
+    other = []
+    t = threading.Thread(target=lambda: other.append(auth.get_credentials()))
+    t.start()
+    t.join()
+    assert other[0] is first
+    assert len(fake_load) == 1
+
+
+def test_expired_credentials_reloaded(fake_load):
+    first = auth.get_credentials()
+    fake_load[0].expired = True
+    assert auth.get_credentials() is not first
+    assert len(fake_load) == 2
+
+
+def test_oauth_flow_clears_account_caches(tmp_path, monkeypatch):
+    """A fresh sign-in may be another account, so its caches are dropped."""
+    from_cache = tmp_path / "from_address.json"
+    contacts_cache = tmp_path / "contacts.json"
+    for path in (from_cache, contacts_cache):
+        path.write_text("{}")
+    monkeypatch.setattr(auth, "FROM_ADDRESS_CACHE_FILE", from_cache)
+    monkeypatch.setattr(auth, "CONTACTS_CACHE_FILE", contacts_cache)
+    monkeypatch.setattr(auth, "CLIENT_SECRET_FILE", tmp_path / "missing.json")
+    monkeypatch.setattr(auth, "_save_token", lambda creds: None)
+    flow = MagicMock()
+    monkeypatch.setattr(
+        "google_auth_oauthlib.flow.InstalledAppFlow.from_client_config",
+        lambda config, scopes: flow,
+    )
+
+    assert auth._run_oauth_flow() is flow.run_local_server.return_value
+    assert not from_cache.exists()
+    assert not contacts_cache.exists()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from unittest.mock import MagicMock
 
 import pytest
@@ -62,6 +63,47 @@ def test_auth_logout_with_token(tmp_path, monkeypatch):
     assert not token_file.exists()
 
 
+@pytest.fixture
+def account_files(tmp_path, monkeypatch):
+    """Point the token and per-account caches at a temp directory."""
+    from jean_claude import auth, cli as cli_module
+
+    files = {
+        "token": tmp_path / "token.json",
+        "from_address": tmp_path / "from_address.json",
+        "contacts": tmp_path / "contacts.json",
+    }
+    monkeypatch.setattr(auth, "CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(auth, "TOKEN_FILE", files["token"])
+    monkeypatch.setattr(cli_module, "TOKEN_FILE", files["token"])
+    monkeypatch.setattr(auth, "FROM_ADDRESS_CACHE_FILE", files["from_address"])
+    monkeypatch.setattr(auth, "CONTACTS_CACHE_FILE", files["contacts"])
+    for path in files.values():
+        path.write_text("{}")
+    return files
+
+
+def test_auth_logout_clears_account_caches(account_files):
+    """Caches tied to the signed-in account are dropped on logout."""
+    result = CliRunner().invoke(cli, ["auth", "--logout"])
+    assert result.exit_code == 0
+    assert not account_files["from_address"].exists()
+    assert not account_files["contacts"].exists()
+
+
+def test_auth_already_authenticated_keeps_caches(account_files):
+    """A no-op auth leaves the account's caches in place."""
+    from jean_claude.auth import SCOPES_FULL
+
+    account_files["token"].write_text(json.dumps({"scopes": SCOPES_FULL}))
+
+    result = CliRunner().invoke(cli, ["auth"])
+    assert result.exit_code == 0
+    assert "Already authenticated" in result.output
+    assert account_files["from_address"].exists()
+    assert account_files["contacts"].exists()
+
+
 def test_status_no_auth(tmp_path, monkeypatch):
     """Test status when not authenticated."""
     from jean_claude import auth, cli as cli_module, whatsapp
@@ -233,7 +275,7 @@ class TestErrorHandling:
         """Base handler returns generic 404 message."""
         error = MagicMock()
         error.resp.status = 404
-        error._get_reason.return_value = "Not Found"
+        error.reason = "Not Found"
 
         msg = handler._http_error_message(error)
         assert msg == "Not found: Not Found"
@@ -242,7 +284,7 @@ class TestErrorHandling:
         """403 shows permission denied."""
         error = MagicMock()
         error.resp.status = 403
-        error._get_reason.return_value = "Forbidden"
+        error.reason = "Forbidden"
         error.__str__ = lambda self: "403 Forbidden"
 
         msg = handler._http_error_message(error)
@@ -252,7 +294,7 @@ class TestErrorHandling:
         """401 suggests re-authentication."""
         error = MagicMock()
         error.resp.status = 401
-        error._get_reason.return_value = "Unauthorized"
+        error.reason = "Unauthorized"
 
         msg = handler._http_error_message(error)
         assert "Authentication failed" in msg
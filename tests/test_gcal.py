@@ -204,7 +204,7 @@ class TestCalendarErrorHandling:
         """404 for event shows event ID, calendar, and tip."""
         error = MagicMock()
         error.resp.status = 404
-        error._get_reason.return_value = "Not Found"
+        error.reason = "Not Found"
         error.uri = (
             "https://www.googleapis.com/calendar/v3/calendars/primary/events/abc123"
         )
@@ -218,7 +218,7 @@ class TestCalendarErrorHandling:
         """404 with URL-encoded calendar ID decodes properly."""
         error = MagicMock()
         error.resp.status = 404
-        error._get_reason.return_value = "Not Found"
+        error.reason = "Not Found"
         error.uri = "https://www.googleapis.com/calendar/v3/calendars/m%40example.com/events/xyz789"
 
         msg = handler._http_error_message(error)
@@ -229,7 +229,7 @@ class TestCalendarErrorHandling:
         """404 for calendar (events list) shows calendar ID and tip."""
         error = MagicMock()
         error.resp.status = 404
-        error._get_reason.return_value = "Not Found"
+        error.reason = "Not Found"
         error.uri = "https://www.googleapis.com/calendar/v3/calendars/nonexistent%40example.com/events?timeMin=..."
 
         msg = handler._http_error_message(error)
@@ -240,7 +240,7 @@ class TestCalendarErrorHandling:
         """Non-404 errors use base class handling."""
         error = MagicMock()
         error.resp.status = 403
-        error._get_reason.return_value = "Forbidden"
+        error.reason = "Forbidden"
         error.__str__ = lambda self: "403 Forbidden"
         error.uri = "https://www.googleapis.com/calendar/v3/calendars/primary/events"
 
@@ -251,7 +251,7 @@ class TestCalendarErrorHandling:
         """404 without URI uses base class handling."""
         error = MagicMock()
         error.resp.status = 404
-        error._get_reason.return_value = "Not Found"
+        error.reason = "Not Found"
         # No uri attribute
         del error.uri
 
@@ -79,7 +79,7 @@ class TestDocsErrorHandling:
         """404 for document shows document ID and tip."""
         error = MagicMock()
         error.resp.status = 404
-        error._get_reason.return_value = "Not Found"
+        error.reason = "Not Found"
         error.uri = "https://docs.googleapis.com/v1/documents/1abc123xyz"
 
         msg = handler._http_error_message(error)
@@ -90,7 +90,7 @@ class TestDocsErrorHandling:
         """Non-404 errors use base class handling."""
         error = MagicMock()
         error.resp.status = 403
-        error._get_reason.return_value = "Forbidden"
+        error.reason = "Forbidden"
         error.__str__ = lambda self: "403 Forbidden"
         error.uri = "https://docs.googleapis.com/v1/documents"
 
@@ -101,7 +101,7 @@ class TestDocsErrorHandling:
         """404 without URI uses base class handling."""
         error = MagicMock()
         error.resp.status = 404
-        error._get_reason.return_value = "Not Found"
+        error.reason = "Not Found"
         del error.uri
 
         msg = handler._http_error_message(error)
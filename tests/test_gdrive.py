@@ -21,7 +21,7 @@ class TestDriveErrorHandling:
         """404 for file shows file ID and tip."""
         error = MagicMock()
         error.resp.status = 404
-        error._get_reason.return_value = "Not Found"
+        error.reason = "Not Found"
         error.uri = "https://www.googleapis.com/drive/v3/files/1abc123xyz"
 
         msg = handler._http_error_message(error)
@@ -32,7 +32,7 @@ class TestDriveErrorHandling:
         """Non-404 errors use base class handling."""
         error = MagicMock()
         error.resp.status = 403
-        error._get_reason.return_value = "Forbidden"
+        error.reason = "Forbidden"
         error.__str__ = lambda self: "403 Forbidden"
         error.uri = "https://www.googleapis.com/drive/v3/files"
 
@@ -43,7 +43,7 @@ class TestDriveErrorHandling:
         """404 without URI uses base class handling."""
         error = MagicMock()
         error.resp.status = 404
-        error._get_reason.return_value = "Not Found"
+        error.reason = "Not Found"
         del error.uri
 
         msg = handler._http_error_message(error)
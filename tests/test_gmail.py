@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import base64
+import binascii
 import json
+import threading
 from email import encoders
 from email import message_from_bytes
 from email.mime.base import MIMEBase
@@ -14,27 +16,52 @@ from email.utils import parseaddr
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import httplib2
 import pytest
+from click.testing import CliRunner
+from googleapiclient.errors import HttpError
 
+from jean_claude.errors import JeanClaudeError
 from jean_claude.gmail import (
+    cli as gmail_cli,
     GmailErrorHandlingGroup,
+    _FETCH_WORKERS,
+    _TokenBucket,
+    _batch_fetch,
     _build_message_with_attachments,
+    _contacts_disk_cache,
     _create_attachment_part,
     _create_reply_draft,
-    _extract_attachments,
     _extract_inline_images,
+    _fetch_attachment_data,
+    _fetch_inline_image_parts,
     _format_recipients,
     _get_part_header,
+    _get_summary_headers,
+    _iter_attachments,
+    _lookup_contact_name,
+    _modify_thread_labels,
+    _retry_on_rate_limit,
     _strip_html,
+    _write_base64url,
     decode_body,
     extract_attachments_from_payload,
     extract_draft_summary,
     extract_inline_images_from_payload,
     extract_message_summary,
     extract_thread_summary,
+    get_my_from_address,
 )
 
 
+@pytest.fixture(autouse=True)
+def unpaced_quota(monkeypatch):
+    """Keep bulk-operation tests from sleeping on the quota token bucket."""
+    monkeypatch.setattr(
+        "jean_claude.gmail._gmail_quota", _TokenBucket(capacity=1e9, rate=1e9)
+    )
+
+
 class TestStripHtml:
     """Tests for HTML stripping."""
 
@@ -72,6 +99,11 @@ class TestStripHtml:
         assert "<3" in result
         assert '"fun"' in result
 
+    def test_numeric_and_named_entities(self):
+        """Test numeric references and less common named entities."""
+        html = "It&#39;s&nbsp;&#x2014; caf&eacute;"
+        assert _strip_html(html) == "It's \u2014 caf\u00e9"
+
     def test_newlines_from_block_elements(self):
         """Test that block elements create newlines."""
         html = "<p>Para 1</p><p>Para 2</p>"
@@ -96,6 +128,28 @@ class TestDecodeBody:
         payload = {"body": {"data": encoded}}
         assert decode_body(payload) == content
 
+    def test_unpadded_body(self):
+        """Test that base64 data missing its padding still decodes."""
+        content = "Hello!!"
+        encoded = base64.urlsafe_b64encode(content.encode()).decode().rstrip("=")
+        assert decode_body({"body": {"data": encoded}}) == content
+
+    def test_first_plain_part_in_document_order_wins(self):
+        """Test that nested traversal keeps MIME document order."""
+        first = base64.urlsafe_b64encode(b"first").decode()
+        second = base64.urlsafe_b64encode(b"second").decode()
+        payload = {
+            "mimeType": "multipart/mixed",
+            "parts": [
+                {
+                    "mimeType": "multipart/alternative",
+                    "parts": [{"mimeType": "text/plain", "body": {"data": first}}],
+                },
+                {"mimeType": "text/plain", "body": {"data": second}},
+            ],
+        }
+        assert decode_body(payload) == "first"
+
     def test_multipart_plain(self):
         """Test multipart with plain text part."""
         import base64
@@ -147,6 +201,35 @@ class TestExtractSummary:
             "labelIds": ["INBOX"],
         }
 
+    def test_cache_files_written_without_temp_leftovers(self, tmp_path, monkeypatch):
+        """Test cache files land atomically with no temporary files left behind."""
+        cache_dir = tmp_path / "emails"
+        monkeypatch.setattr("jean_claude.gmail.EMAIL_CACHE_DIR", cache_dir)
+
+        msg = self._make_message([("Subject", "Test")])
+        msg["payload"]["body"]["data"] = base64.urlsafe_b64encode(b"Hi").decode()
+
+        result = extract_message_summary(msg)
+        assert json.loads(Path(result["file"]).read_text())["id"] == "msg123"
+        assert (cache_dir / "email-msg123.txt").read_text() == "Hi"
+        assert sorted(p.suffix for p in cache_dir.iterdir()) == [".json", ".txt"]
+
+    def test_summary_headers_subset(self):
+        """Test only summary headers are collected; repeated headers keep the last."""
+        msg = self._make_message(
+            [
+                ("Received", "from mx.example.com"),
+                ("FROM", "sender@example.com"),
+                ("Subject", "First"),
+                ("Subject", "Second"),
+                ("DKIM-Signature", "v=1"),
+            ]
+        )
+        assert _get_summary_headers(msg) == {
+            "from": "sender@example.com",
+            "subject": "Second",
+        }
+
     def test_extract_message_cc_uppercase(self, tmp_path, monkeypatch):
         """Test CC header detection with Microsoft Exchange casing (all caps)."""
         monkeypatch.setattr("jean_claude.gmail.EMAIL_CACHE_DIR", tmp_path)
@@ -322,8 +405,7 @@ class TestExtractAttachments:
         parts = [
             {"mimeType": "text/plain", "body": {"data": "SGVsbG8="}},
         ]
-        attachments: list = []
-        _extract_attachments(parts, attachments)
+        attachments = list(_iter_attachments(parts))
         assert attachments == []
 
     def test_single_attachment(self):
@@ -336,8 +418,7 @@ class TestExtractAttachments:
                 "body": {"attachmentId": "ANGjdJ8xyz", "size": 12345},
             },
         ]
-        attachments: list = []
-        _extract_attachments(parts, attachments)
+        attachments = list(_iter_attachments(parts))
         assert len(attachments) == 1
         assert attachments[0]["filename"] == "report.pdf"
         assert attachments[0]["mimeType"] == "application/pdf"
@@ -358,8 +439,7 @@ class TestExtractAttachments:
                 "body": {"attachmentId": "id2", "size": 200},
             },
         ]
-        attachments: list = []
-        _extract_attachments(parts, attachments)
+        attachments = list(_iter_attachments(parts))
         assert len(attachments) == 2
         assert attachments[0]["filename"] == "doc1.pdf"
         assert attachments[1]["filename"] == "image.png"
@@ -379,22 +459,55 @@ class TestExtractAttachments:
                 ],
             },
         ]
-        attachments: list = []
-        _extract_attachments(parts, attachments)
+        attachments = list(_iter_attachments(parts))
         assert len(attachments) == 1
         assert attachments[0]["filename"] == "nested.pdf"
 
+    def test_nested_attachments_in_document_order(self):
+        """Nested attachments come out in the order they appear in the message."""
+
+        def att(name: str) -> dict:
+            return {"filename": name, "body": {"attachmentId": name, "size": 1}}
+
+        parts = [
+            {"mimeType": "multipart/mixed", "parts": [att("a"), att("b")]},
+            att("c"),
+        ]
+        assert [a["filename"] for a in _iter_attachments(parts)] == ["a", "b", "c"]
+
     def test_filename_without_attachment_id(self):
-        """Test that parts with filename but no attachmentId are skipped."""
+        """Test that small attachments with inline data get a synthetic ID."""
         parts = [
             {
+                "partId": "1",
                 "filename": "inline.gif",
                 "mimeType": "image/gif",
-                "body": {"data": "R0lGODlh"},  # inline, no attachmentId
+                "body": {"data": "R0lGODlh", "size": 6},  # inline, no attachmentId
+            },
+        ]
+        attachments = list(_iter_attachments(parts))
+        assert len(attachments) == 1
+        assert attachments[0]["attachmentId"] == "inline:1"
+        assert attachments[0]["data"] == "R0lGODlh"
+
+    def test_inline_attachment_listed_without_data(self):
+        """Test inline parts are listed when the fields mask omits body data."""
+        parts = [
+            {
+                "partId": "2",
+                "filename": "small.txt",
+                "mimeType": "text/plain",
+                "body": {"size": 12},
             },
         ]
-        attachments: list = []
-        _extract_attachments(parts, attachments)
+        attachments = list(_iter_attachments(parts))
+        assert attachments[0]["attachmentId"] == "inline:2"
+        assert "data" not in attachments[0]
+
+    def test_filename_with_empty_body_skipped(self):
+        """Test that named parts with no data at all are skipped."""
+        parts = [{"filename": "empty.txt", "mimeType": "text/plain", "body": {}}]
+        attachments = list(_iter_attachments(parts))
         assert attachments == []
 
     def test_payload_is_attachment(self):
@@ -411,8 +524,7 @@ class TestExtractAttachments:
             "headers": [{"name": "Content-Type", "value": "application/zip"}],
             "body": {"attachmentId": "ANGjdJ9PBPzOfITU", "size": 726},
         }
-        attachments: list = []
-        _extract_attachments([payload], attachments)
+        attachments = list(_iter_attachments([payload]))
         assert len(attachments) == 1
         assert attachments[0]["filename"] == "dmarc-report.zip"
         assert attachments[0]["mimeType"] == "application/zip"
@@ -479,7 +591,7 @@ class TestGmailErrorHandling:
         """404 for message shows message ID and tip."""
         error = MagicMock()
         error.resp.status = 404
-        error._get_reason.return_value = "Not Found"
+        error.reason = "Not Found"
         error.uri = "https://gmail.googleapis.com/gmail/v1/users/me/messages/19abc123"
 
         msg = handler._http_error_message(error)
@@ -490,7 +602,7 @@ class TestGmailErrorHandling:
         """404 for thread shows thread ID and tip."""
         error = MagicMock()
         error.resp.status = 404
-        error._get_reason.return_value = "Not Found"
+        error.reason = "Not Found"
         error.uri = "https://gmail.googleapis.com/gmail/v1/users/me/threads/19xyz789"
 
         msg = handler._http_error_message(error)
@@ -501,7 +613,7 @@ class TestGmailErrorHandling:
         """404 for draft shows draft ID and tip."""
         error = MagicMock()
         error.resp.status = 404
-        error._get_reason.return_value = "Not Found"
+        error.reason = "Not Found"
         error.uri = "https://gmail.googleapis.com/gmail/v1/users/me/drafts/r-123456"
 
         msg = handler._http_error_message(error)
@@ -512,7 +624,7 @@ class TestGmailErrorHandling:
         """404 for filter shows filter ID and tip."""
         error = MagicMock()
         error.resp.status = 404
-        error._get_reason.return_value = "Not Found"
+        error.reason = "Not Found"
         error.uri = (
             "https://gmail.googleapis.com/gmail/v1/users/me/settings/filters/ANe1BmjXYZ"
         )
@@ -525,7 +637,7 @@ class TestGmailErrorHandling:
         """404 for attachment shows attachment ID, message ID, and tip."""
         error = MagicMock()
         error.resp.status = 404
-        error._get_reason.return_value = "Not Found"
+        error.reason = "Not Found"
         error.uri = "https://gmail.googleapis.com/gmail/v1/users/me/messages/19abc123/attachments/ANGjdJ8xyz"
 
         msg = handler._http_error_message(error)
@@ -537,7 +649,7 @@ class TestGmailErrorHandling:
         """404 for label shows label ID and tip."""
         error = MagicMock()
         error.resp.status = 404
-        error._get_reason.return_value = "Not Found"
+        error.reason = "Not Found"
         error.uri = "https://gmail.googleapis.com/gmail/v1/users/me/labels/Label_123"
 
         msg = handler._http_error_message(error)
@@ -548,7 +660,7 @@ class TestGmailErrorHandling:
         """Non-404 errors use base class handling."""
         error = MagicMock()
         error.resp.status = 403
-        error._get_reason.return_value = "Forbidden"
+        error.reason = "Forbidden"
         error.__str__ = lambda self: "403 Forbidden"
         error.uri = "https://gmail.googleapis.com/gmail/v1/users/me/messages"
 
@@ -559,7 +671,7 @@ class TestGmailErrorHandling:
         """404 without URI uses base class handling."""
         error = MagicMock()
         error.resp.status = 404
-        error._get_reason.return_value = "Not Found"
+        error.reason = "Not Found"
         del error.uri
 
         msg = handler._http_error_message(error)
@@ -897,47 +1009,158 @@ class TestFormatRecipientsUnicode:
         assert "<rdupont@example.org>" in to_line
 
 
-class TestReplyUnicodeSender:
-    """_create_reply_draft must build a valid To header when the original
-    sender's display name contains non-ASCII characters."""
+@pytest.fixture
+def contacts_cache(tmp_path, monkeypatch):
+    """Isolate contact lookups: temp on-disk cache and empty in-memory caches."""
+    cache_file = tmp_path / "contacts.json"
+    monkeypatch.setattr("jean_claude.gmail.CONTACTS_CACHE_FILE", cache_file)
+    caches = (
+        _contacts_disk_cache,
+        _lookup_contact_name,
+    )
+    for cache in caches:
+        cache.cache_clear()
+    yield cache_file
+    for cache in caches:
+        cache.cache_clear()
+
+
+class TestContactsDiskCache:
+    """Contact lookups persist across CLI invocations."""
+
+    def _people(self, name: str | None) -> MagicMock:
+        people = MagicMock()
+        results = []
+        if name:
+            results = [
+                {
+                    "person": {
+                        "names": [{"displayName": name}],
+                        "emailAddresses": [{"value": "ada@example.com"}],
+                    }
+                }
+            ]
+        people.people().searchContacts().execute.return_value = {"results": results}
+        return people
+
+    def test_lookup_persisted_and_reused(self, contacts_cache, monkeypatch):
+        people = self._people("Ada Lovelace")
+        monkeypatch.setattr("jean_claude.gmail.get_people", lambda: people)
+
+        assert _lookup_contact_name("ada@example.com") == "Ada Lovelace"
+        stored = json.loads(contacts_cache.read_text())
+        assert stored["ada@example.com"][0] == "Ada Lovelace"
+
+        # A fresh process reads the name from disk without calling the API
+        _contacts_disk_cache.cache_clear()
+        _lookup_contact_name.cache_clear()
+        monkeypatch.setattr(
+            "jean_claude.gmail.get_people", MagicMock(side_effect=AssertionError)
+        )
+        assert _lookup_contact_name("ADA@example.com") == "Ada Lovelace"
+
+    def test_expired_entries_are_refetched(self, contacts_cache, monkeypatch):
+        contacts_cache.write_text(json.dumps({"ada@example.com": ["Old Name", 0]}))
+        people = self._people("Ada Lovelace")
+        monkeypatch.setattr("jean_claude.gmail.get_people", lambda: people)
+
+        assert _lookup_contact_name("ada@example.com") == "Ada Lovelace"
+
+    def test_malformed_entries_are_ignored(self, contacts_cache, monkeypatch):
+        contacts_cache.write_text(json.dumps({"ada@example.com": ["A", None]}))
+        people = self._people("Ada Lovelace")
+        monkeypatch.setattr("jean_claude.gmail.get_people", lambda: people)
+
+        assert _lookup_contact_name("ada@example.com") == "Ada Lovelace"
+
+    def test_misses_are_cached(self, contacts_cache, monkeypatch):
+        people = self._people(None)
+        monkeypatch.setattr("jean_claude.gmail.get_people", lambda: people)
+
+        assert _lookup_contact_name("ada@example.com") is None
+        assert json.loads(contacts_cache.read_text())["ada@example.com"][0] is None
+
 
-    def _make_service(self, original_from: str, captured: dict) -> MagicMock:
+class TestFromAddressCache:
+    """The user's From address persists across CLI invocations."""
+
+    def _service(self) -> MagicMock:
         service = MagicMock()
-        original_message = {
-            "id": "msg-abc",
-            "threadId": "thread-xyz",
-            "labelIds": ["INBOX"],
-            "payload": {
-                "headers": [
-                    {"name": "From", "value": original_from},
-                    {"name": "To", "value": "me@example.com"},
-                    {"name": "Subject", "value": "Hello"},
-                    {"name": "Date", "value": "Mon, 1 Jan 2024 12:00:00 +0000"},
-                    {"name": "Message-ID", "value": "<orig@mail.example>"},
-                ],
-                "body": {"data": ""},
-                "mimeType": "text/plain",
-            },
+        service.users().settings().sendAs().list().execute.return_value = {
+            "sendAs": [
+                {
+                    "isPrimary": True,
+                    "sendAsEmail": "me@example.com",
+                    "displayName": "Me",
+                }
+            ]
         }
-        service.users().messages().get().execute.return_value = original_message
+        return service
 
-        def capture_create(userId: str, body: dict):
-            captured["raw"] = body["message"]["raw"]
-            result_mock = MagicMock()
-            result_mock.execute.return_value = {
-                "id": "draft-id",
-                "message": {"id": "msg-new"},
-            }
-            return result_mock
+    def test_cached_on_disk(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            "jean_claude.gmail.FROM_ADDRESS_CACHE_FILE", tmp_path / "from.json"
+        )
+        assert get_my_from_address(self._service()) == "Me <me@example.com>"
 
-        service.users().drafts().create.side_effect = capture_create
-        return service
+        service = MagicMock()
+        service.users().settings().sendAs().list().execute.side_effect = AssertionError
+        assert get_my_from_address(service) == "Me <me@example.com>"
+
+    def test_expired_entry_is_refetched(self, tmp_path, monkeypatch):
+        cache_file = tmp_path / "from.json"
+        cache_file.write_text(
+            json.dumps({"address": "old@example.com", "timestamp": 0})
+        )
+        monkeypatch.setattr("jean_claude.gmail.FROM_ADDRESS_CACHE_FILE", cache_file)
+
+        assert get_my_from_address(self._service()) == "Me <me@example.com>"
+        assert json.loads(cache_file.read_text())["address"] == "Me <me@example.com>"
+
+
+def _reply_service(original_from: str, captured: dict) -> MagicMock:
+    """Fake Gmail service holding one message to reply to; captures the draft."""
+    service = MagicMock()
+    original_message = {
+        "id": "msg-abc",
+        "threadId": "thread-xyz",
+        "labelIds": ["INBOX"],
+        "payload": {
+            "headers": [
+                {"name": "From", "value": original_from},
+                {"name": "To", "value": "me@example.com"},
+                {"name": "Subject", "value": "Hello"},
+                {"name": "Date", "value": "Mon, 1 Jan 2024 12:00:00 +0000"},
+                {"name": "Message-ID", "value": "<orig@mail.example>"},
+            ],
+            "body": {"data": ""},
+            "mimeType": "text/plain",
+        },
+    }
+    service.users().messages().get().execute.return_value = original_message
+
+    def capture_create(userId: str, body: dict):
+        captured["raw"] = body["message"]["raw"]
+        result_mock = MagicMock()
+        result_mock.execute.return_value = {
+            "id": "draft-id",
+            "message": {"id": "msg-new"},
+        }
+        return result_mock
+
+    service.users().drafts().create.side_effect = capture_create
+    return service
+
+
+class TestReplyUnicodeSender:
+    """_create_reply_draft must build a valid To header when the original
+    sender's display name contains non-ASCII characters."""
 
     def test_unicode_display_name_in_from_produces_valid_to_header(
         self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         captured: dict = {}
-        service = self._make_service('"Renée Dupont" <rdupont@example.org>', captured)
+        service = _reply_service('"Renée Dupont" <rdupont@example.org>', captured)
         monkeypatch.setattr("jean_claude.gmail.get_gmail", lambda: service)
         monkeypatch.setattr(
             "jean_claude.gmail.get_my_from_address", lambda _s: "me@example.com"
@@ -958,3 +1181,539 @@ class TestReplyUnicodeSender:
         encoded_name, addr = parseaddr(to_header)
         assert addr == "rdupont@example.org"
         assert str(make_header(decode_header(encoded_name))) == "Renée Dupont"
+
+
+class TestReplyNoQuote:
+    """Replies without a quote fetch only the original's headers."""
+
+    def test_fetches_metadata_and_omits_quote(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        captured: dict = {}
+        service = _reply_service("Ada <a@example.com>", captured)
+        monkeypatch.setattr("jean_claude.gmail.get_gmail", lambda: service)
+        monkeypatch.setattr(
+            "jean_claude.gmail.get_my_from_address", lambda _s: "me@example.com"
+        )
+        monkeypatch.setattr(
+            "jean_claude.gmail._fetch_inline_image_parts",
+            MagicMock(side_effect=AssertionError),
+        )
+
+        _create_reply_draft("msg-abc", "Thanks!", include_cc=False, quote=False)
+
+        get_kwargs = service.users().messages().get.call_args.kwargs
+        assert get_kwargs["format"] == "metadata"
+        assert "References" in get_kwargs["metadataHeaders"]
+        parsed = message_from_bytes(base64.urlsafe_b64decode(captured["raw"]))
+        assert parsed.get_content_type() == "text/plain"
+        assert parsed.get_payload() == "Thanks!"
+        assert parsed["In-Reply-To"] == "<orig@mail.example>"
+
+
+def _http_error(
+    status: int, headers: dict | None = None, reason: str | None = None
+) -> HttpError:
+    resp = httplib2.Response({"status": status, **(headers or {})})
+    # Real Google errors carry both the legacy errors list and a google.rpc
+    # details list; HttpError.error_details prefers details.
+    content = {
+        "error": {
+            "code": status,
+            "message": reason,
+            "errors": [{"reason": reason}],
+            "details": [
+                {
+                    "@type": "type.googleapis.com/google.rpc.ErrorInfo",
+                    "reason": "RATE_LIMIT_EXCEEDED",
+                }
+            ],
+        }
+    }
+    return HttpError(resp, json.dumps(content).encode() if reason else b"{}")
+
+
+def _calls_then(*results):
+    """Return a function that raises or returns each of ``results`` in turn."""
+    calls = iter(results)
+
+    def func():
+        result = next(calls)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return func
+
+
+class TestRetryOnRateLimit:
+    """Tests for retry handling of rate limits and transient errors."""
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch: pytest.MonkeyPatch) -> list[float]:
+        sleeps: list[float] = []
+        monkeypatch.setattr("jean_claude.gmail.time.sleep", sleeps.append)
+        return sleeps
+
+    def test_honors_retry_after(self, sleeps: list[float]) -> None:
+        """A 429 with Retry-After waits that long, plus jitter."""
+        func = _calls_then(_http_error(429, {"retry-after": "5"}), "ok")
+
+        assert _retry_on_rate_limit(func) == "ok"
+        assert len(sleeps) == 1
+        assert 5 <= sleeps[0] <= 5.5
+
+    def test_caps_retry_after(self, sleeps: list[float]) -> None:
+        """An excessive Retry-After is capped at a minute."""
+        func = _calls_then(_http_error(429, {"retry-after": "3600"}), "ok")
+
+        assert _retry_on_rate_limit(func) == "ok"
+        assert 60 <= sleeps[0] <= 66
+
+    def test_retries_transient_server_error(self, sleeps: list[float]) -> None:
+        """A 503 is retried with exponential backoff."""
+        func = _calls_then(_http_error(503), "ok")
+
+        assert _retry_on_rate_limit(func) == "ok"
+        assert 2 <= sleeps[0] <= 2.2
+
+    def test_does_not_retry_client_error(self, sleeps: list[float]) -> None:
+        """A 400 is raised immediately."""
+        func = _calls_then(_http_error(400))
+
+        with pytest.raises(HttpError):
+            _retry_on_rate_limit(func)
+        assert sleeps == []
+
+    def test_retries_403_rate_limit_reason(self, sleeps: list[float]) -> None:
+        """A 403 whose reason is a rate limit is retried."""
+        func = _calls_then(_http_error(403, reason="userRateLimitExceeded"), "ok")
+
+        assert _retry_on_rate_limit(func) == "ok"
+        assert len(sleeps) == 1
+
+    def test_does_not_retry_plain_403(self, sleeps: list[float]) -> None:
+        """A 403 for any other reason is raised immediately."""
+        func = _calls_then(_http_error(403, reason="insufficientPermissions"))
+
+        with pytest.raises(HttpError):
+            _retry_on_rate_limit(func)
+        assert sleeps == []
+
+    def test_persistent_403_rate_limit_raises(self, sleeps: list[float]) -> None:
+        """A rate limit that outlasts every retry becomes a JeanClaudeError."""
+        func = _calls_then(*[_http_error(403, reason="rateLimitExceeded")] * 4)
+
+        with pytest.raises(JeanClaudeError, match="rate limit exceeded"):
+            _retry_on_rate_limit(func)
+        assert len(sleeps) == 3
+
+
+class FakeBatch:
+    """Minimal stand-in for googleapiclient's BatchHttpRequest."""
+
+    def __init__(self, responses: dict, callback):
+        self.responses = responses
+        self.callback = callback
+        self.request_ids: list[str] = []
+
+    def add(self, request, request_id: str) -> None:
+        self.request_ids.append(request_id)
+
+    def execute(self) -> None:
+        for request_id in self.request_ids:
+            response = self.responses.get(request_id)
+            if isinstance(response, Exception):
+                self.callback(request_id, None, response)
+            else:
+                self.callback(request_id, response, None)
+
+
+def _batch_service(responses: dict) -> tuple[MagicMock, list[FakeBatch]]:
+    """Return a mock service whose batches answer from ``responses``.
+
+    Also returns the list of FakeBatches the service has created, in order.
+    """
+    batches: list[FakeBatch] = []
+
+    def new_batch(callback) -> FakeBatch:
+        batches.append(FakeBatch(responses, callback))
+        return batches[-1]
+
+    service = MagicMock()
+    service.new_batch_http_request.side_effect = new_batch
+    return service, batches
+
+
+def test_write_base64url_in_chunks(tmp_path, monkeypatch):
+    """Chunked decoding matches decoding in one go, including unpadded tails."""
+    monkeypatch.setattr("jean_claude.gmail._DECODE_CHUNK_CHARS", 8)
+    payload = bytes(range(256)) * 3 + b"tail"
+    encoded = base64.urlsafe_b64encode(payload).decode().rstrip("=")
+    path = tmp_path / "out.bin"
+
+    assert _write_base64url(path, encoded) == len(payload)
+    assert path.read_bytes() == payload
+
+
+def test_write_base64url_decode_error_leaves_no_partial_file(tmp_path, monkeypatch):
+    """A decode error after the first chunk keeps the old file and no temp file."""
+    monkeypatch.setattr("jean_claude.gmail._DECODE_CHUNK_CHARS", 8)
+    path = tmp_path / "out.bin"
+    path.write_bytes(b"previous")
+
+    # The second chunk is a single character, which no base64 length allows
+    encoded = base64.urlsafe_b64encode(b"abcdef").decode() + "A"
+    with pytest.raises(binascii.Error):
+        _write_base64url(path, encoded)
+
+    assert path.read_bytes() == b"previous"
+    assert [p.name for p in tmp_path.iterdir()] == ["out.bin"]
+
+
+class TestFetchAttachmentData:
+    """Tests for batched attachment downloads."""
+
+    def test_batches_remote_and_decodes_inline(self) -> None:
+        remote = {
+            "att1": {"data": base64.urlsafe_b64encode(b"one").decode()},
+            "att2": {"data": base64.urlsafe_b64encode(b"two").decode()},
+        }
+        service, batches = _batch_service(remote)
+        attachments = [
+            {"attachmentId": "att1"},
+            {"attachmentId": "att2"},
+            {"attachmentId": "att1"},
+            {"attachmentId": "inline:3", "data": "aW5saW5l"},
+        ]
+
+        result = _fetch_attachment_data(service, "msg1", attachments)
+
+        assert result == {"att1": b"one", "att2": b"two", "inline:3": b"inline"}
+        assert len(batches) == 1
+        assert batches[0].request_ids == ["att1", "att2"]
+
+
+class TestFetchInlineImageParts:
+    """Tests for batched inline image fetches."""
+
+    def test_one_batch_and_failed_images_skipped(self) -> None:
+        remote = {
+            "img1": {"data": base64.urlsafe_b64encode(b"png").decode()},
+            "img2": _http_error(404),
+        }
+        service, _ = _batch_service(remote)
+        payload = {
+            "parts": [
+                {
+                    "mimeType": "image/png",
+                    "headers": [{"name": "Content-ID", "value": f"<{aid}>"}],
+                    "body": {"attachmentId": aid},
+                }
+                for aid in ("img1", "img2")
+            ]
+        }
+
+        parts, fetched = _fetch_inline_image_parts(
+            service, "msg1", payload, '<img src="cid:img1">'
+        )
+
+        assert fetched == {"img1"}
+        assert [p["Content-ID"] for p in parts] == ["<img1>"]
+        assert parts[0].get_payload(decode=True) == b"png"
+        assert service.new_batch_http_request.call_count == 1
+
+
+class TestDraftForward:
+    """Tests for forwarding with inline images and attachments."""
+
+    def test_inline_images_and_attachments_in_one_batch(self, monkeypatch) -> None:
+        def encode(text: str) -> str:
+            return base64.urlsafe_b64encode(text.encode()).decode()
+
+        original = {
+            "id": "msg1",
+            "threadId": "t1",
+            "payload": {
+                "headers": [
+                    {"name": "From", "value": "Ada <ada@example.com>"},
+                    {"name": "Subject", "value": "Report"},
+                    {"name": "Date", "value": "Mon, 1 Jan 2024 12:00:00 +0000"},
+                ],
+                "parts": [
+                    {
+                        "mimeType": "text/html",
+                        "body": {"data": encode('<img src="cid:logo">')},
+                    },
+                    {
+                        "mimeType": "image/png",
+                        "headers": [{"name": "Content-ID", "value": "<logo>"}],
+                        "body": {"attachmentId": "img1", "size": 3},
+                    },
+                    {
+                        "filename": "report.pdf",
+                        "mimeType": "application/pdf",
+                        "body": {"attachmentId": "att1", "size": 3},
+                    },
+                ],
+            },
+        }
+        remote = {"img1": {"data": encode("png")}, "att1": {"data": encode("pdf")}}
+        captured: dict = {}
+
+        def capture_create(userId: str, body: dict):
+            captured["raw"] = body["message"]["raw"]
+            result = MagicMock()
+            result.execute.return_value = {"id": "d1", "message": {"id": "m2"}}
+            return result
+
+        service, batches = _batch_service(remote)
+        service.users().messages().get().execute.return_value = original
+        service.users().drafts().create.side_effect = capture_create
+        monkeypatch.setattr("jean_claude.gmail.get_gmail", lambda: service)
+        monkeypatch.setattr(
+            "jean_claude.gmail.get_my_from_address", lambda _s: "me@example.com"
+        )
+
+        result = CliRunner().invoke(
+            gmail_cli,
+            ["draft", "forward", "msg1", "Bob <bob@example.com>"],
+            input="",
+        )
+
+        assert result.exit_code == 0, result.output
+        assert [b.request_ids for b in batches] == [["img1", "att1"]]
+        sent = message_from_bytes(base64.urlsafe_b64decode(captured["raw"]))
+        payloads = {
+            part.get("Content-ID") or part.get_filename(): part.get_payload(decode=True)
+            for part in sent.walk()
+            if part.get_content_maintype() in ("image", "application")
+        }
+        assert payloads == {"<logo>": b"png", "report.pdf": b"pdf"}
+
+
+class TestArchiveQuery:
+    """Tests for archive --query pagination."""
+
+    def test_follows_pages_up_to_max_results(self, monkeypatch) -> None:
+        pages = [
+            {"threads": [{"id": f"t{i}"} for i in range(500)], "nextPageToken": "p2"},
+            {"threads": [{"id": f"u{i}"} for i in range(100)], "nextPageToken": "p3"},
+        ]
+        service = MagicMock()
+        service.users().threads().list().execute.side_effect = pages
+        service.users().threads().list.reset_mock()
+        archived: list[str] = []
+        monkeypatch.setattr("jean_claude.gmail.get_gmail", lambda: service)
+        monkeypatch.setattr(
+            "jean_claude.gmail._modify_thread_labels",
+            lambda _svc, ids, **kwargs: archived.extend(ids) or len(ids),
+        )
+
+        result = CliRunner().invoke(gmail_cli, ["archive", "-q", "x", "-n", "600"])
+
+        assert result.exit_code == 0, result.output
+        assert len(archived) == 600
+        calls = service.users().threads().list.call_args_list
+        assert [c.kwargs["maxResults"] for c in calls] == [500, 100]
+        assert calls[1].kwargs["pageToken"] == "p2"
+
+
+class TestModifyThreadLabels:
+    """Tests for batched thread label changes."""
+
+    def test_batches_in_chunks_of_50(self) -> None:
+        service, batches = _batch_service({})
+        ids = [f"t{i}" for i in range(120)] + ["t0"]
+
+        n = _modify_thread_labels(service, ids, remove_label_ids=["INBOX"])
+
+        assert n == 120  # the repeated t0 is sent and counted once
+        assert [len(b.request_ids) for b in batches] == [50, 50, 20]
+        service.users().threads().modify.assert_called_with(
+            userId="me", id="t119", body={"removeLabelIds": ["INBOX"]}
+        )
+
+
+class TestBatchFetch:
+    """Tests for concurrent batch fetching."""
+
+    def test_multiple_batches_merge_responses(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        items = [{"id": f"m{i}"} for i in range(40)]
+        remote = {item["id"]: {"id": item["id"]} for item in items}
+        service, batches = _batch_service(remote)
+        monkeypatch.setattr("jean_claude.gmail.get_gmail", lambda: service)
+
+        responses = _batch_fetch(
+            service, items, lambda svc, mid: svc.get(mid), chunk_size=15
+        )
+
+        assert responses == remote
+        assert sorted(len(b.request_ids) for b in batches) == [10, 15, 15]
+
+    def test_workers_reused_across_calls(self, monkeypatch) -> None:
+        """Later fetches reuse the same worker threads and their services."""
+        items = [{"id": f"m{i}"} for i in range(30)]
+        remote = {item["id"]: {"id": item["id"]} for item in items}
+        threads: set[str] = set()
+
+        def get_gmail():
+            threads.add(threading.current_thread().name)
+            service, _ = _batch_service(remote)
+            return service
+
+        monkeypatch.setattr("jean_claude.gmail.get_gmail", get_gmail)
+        for _ in range(3):
+            _batch_fetch(None, items, lambda svc, mid: svc.get(mid), chunk_size=5)
+
+        assert len(threads) <= _FETCH_WORKERS
+
+
+class TestTokenBucket:
+    """Tests for client-side quota pacing."""
+
+    def test_waits_only_once_budget_is_spent(self, monkeypatch) -> None:
+        clock = [100.0]
+        sleeps: list[float] = []
+
+        def sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        monkeypatch.setattr("jean_claude.gmail.time.monotonic", lambda: clock[0])
+        monkeypatch.setattr("jean_claude.gmail.time.sleep", sleep)
+        bucket = _TokenBucket(capacity=250, rate=250)
+
+        bucket.consume(500)  # full bucket: goes out immediately, 250 in debt
+        assert sleeps == []
+        bucket.consume(500)  # waits for the 250-unit debt to refill
+        assert sleeps == [1.0]
+        clock[0] += 10  # idle period refills to capacity, no more
+        bucket.consume(100)
+        assert sleeps == [1.0]
+
+
+def _not_found(path: str) -> HttpError:
+    """A 404 as BatchHttpRequest reports it, with the sub-request's URI."""
+    return HttpError(
+        httplib2.Response({"status": 404}),
+        b"{}",
+        uri=f"https://gmail.googleapis.com/gmail/v1/users/me/{path}?alt=json",
+    )
+
+
+class TestMessageCommand:
+    """Tests for the batched message command."""
+
+    def test_batches_and_preserves_order(self, tmp_path, monkeypatch) -> None:
+        def make_msg(mid: str, labels: list[str]) -> dict:
+            return {
+                "id": mid,
+                "threadId": f"thread-{mid}",
+                "labelIds": labels,
+                "payload": {"headers": [{"name": "Subject", "value": mid}]},
+            }
+
+        remote = {"b": make_msg("b", ["UNREAD"]), "a": make_msg("a", [])}
+        service, _ = _batch_service(remote)
+        monkeypatch.setattr("jean_claude.gmail.get_gmail", lambda: service)
+        monkeypatch.setattr("jean_claude.gmail.EMAIL_CACHE_DIR", tmp_path)
+
+        result = CliRunner().invoke(gmail_cli, ["message", "b", "a", "b"])
+
+        assert result.exit_code == 0, result.output
+        # Unconfigured structlog prints the mark-read hint after the JSON
+        summaries, _ = json.JSONDecoder().raw_decode(result.stdout)
+        assert [m["subject"] for m in summaries] == ["b", "a", "b"]
+        assert service.new_batch_http_request.call_count == 1
+
+    def test_not_found_names_message_with_tip(self, monkeypatch) -> None:
+        """A missing message gets the group's 404 message, not a bare ID."""
+        service, _ = _batch_service({"abc": _not_found("messages/abc")})
+        monkeypatch.setattr("jean_claude.gmail.get_gmail", lambda: service)
+        logger = MagicMock()
+        monkeypatch.setattr("jean_claude.errors.logger", logger)
+
+        result = CliRunner().invoke(gmail_cli, ["message", "abc"])
+
+        assert result.exit_code == 1
+        (message,) = logger.error.call_args.args
+        assert "Message not found: abc" in message
+        assert "jean-claude gmail search" in message
+
+
+class TestAttachmentsCommand:
+    """Tests for the attachments listing command."""
+
+    def test_deeply_nested_inline_data_not_printed(self, monkeypatch) -> None:
+        """Parts nested past the fields mask are listed without their data."""
+        part = {
+            "partId": "deep",
+            "filename": "deep.txt",
+            "mimeType": "text/plain",
+            "body": {"data": "aGVsbG8", "size": 5},
+        }
+        for _ in range(10):
+            part = {"mimeType": "multipart/mixed", "parts": [part]}
+        service = MagicMock()
+        service.users().messages().get().execute.return_value = {"payload": part}
+        monkeypatch.setattr("jean_claude.gmail.get_gmail", lambda: service)
+
+        result = CliRunner().invoke(gmail_cli, ["attachments", "msg1"])
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output) == [
+            {
+                "filename": "deep.txt",
+                "mimeType": "text/plain",
+                "size": 5,
+                "attachmentId": "inline:deep",
+            }
+        ]
+        fields = service.users().messages().get.call_args.kwargs["fields"]
+        assert fields.count("parts(") == 8
+
+
+class TestThreadCommand:
+    """Tests for the batched thread command."""
+
+    def test_batches_and_preserves_order(self, tmp_path, monkeypatch) -> None:
+        def make_thread(tid: str, subjects: list[str]) -> dict:
+            messages = [
+                {
+                    "id": subject,
+                    "threadId": tid,
+                    "labelIds": [],
+                    "payload": {"headers": [{"name": "Subject", "value": subject}]},
+                }
+                for subject in subjects
+            ]
+            return {"id": tid, "messages": messages}
+
+        remote = {"t2": make_thread("t2", ["c"]), "t1": make_thread("t1", ["a", "b"])}
+        service, _ = _batch_service(remote)
+        monkeypatch.setattr("jean_claude.gmail.get_gmail", lambda: service)
+        monkeypatch.setattr("jean_claude.gmail.EMAIL_CACHE_DIR", tmp_path)
+
+        result = CliRunner().invoke(gmail_cli, ["thread", "t2", "t1"])
+
+        assert result.exit_code == 0, result.output
+        summaries = json.loads(result.stdout)
+        assert [m["subject"] for m in summaries] == ["c", "a", "b"]
+        assert service.new_batch_http_request.call_count == 1
+
+    def test_not_found_names_thread_with_tip(self, monkeypatch) -> None:
+        """A missing thread gets the group's 404 message, not a bare ID."""
+        service, _ = _batch_service({"t9": _not_found("threads/t9")})
+        monkeypatch.setattr("jean_claude.gmail.get_gmail", lambda: service)
+        logger = MagicMock()
+        monkeypatch.setattr("jean_claude.errors.logger", logger)
+
+        result = CliRunner().invoke(gmail_cli, ["thread", "t9"])
+
+        assert result.exit_code == 1
+        (message,) = logger.error.call_args.args
+        assert "Thread not found: t9" in message
+        assert "jean-claude gmail inbox" in message
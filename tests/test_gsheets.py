@@ -5,8 +5,12 @@ import json
 import sys
 from unittest.mock import MagicMock
 
+import httplib2
 import pytest
+from click.testing import CliRunner
+from googleapiclient.errors import HttpError
 
+from jean_claude import gsheets
 from jean_claude.gsheets import (
     SheetsErrorHandlingGroup,
     _column_to_index,
@@ -16,6 +20,14 @@ from jean_claude.gsheets import (
 from jean_claude.logging import JeanClaudeError
 
 
+@pytest.fixture
+def service(monkeypatch):
+    """A mock Sheets service returned by get_sheets."""
+    service = MagicMock()
+    monkeypatch.setattr(gsheets, "get_sheets", lambda: service)
+    return service
+
+
 class TestNormalizeRange:
     """Tests for _normalize_range function."""
 
@@ -145,7 +157,7 @@ class TestSheetsErrorHandling:
         """404 for spreadsheet shows spreadsheet ID and tip."""
         error = MagicMock()
         error.resp.status = 404
-        error._get_reason.return_value = "Not Found"
+        error.reason = "Not Found"
         error.uri = "https://sheets.googleapis.com/v4/spreadsheets/1abc123xyz"
 
         msg = handler._http_error_message(error)
@@ -156,7 +168,7 @@ class TestSheetsErrorHandling:
         """404 for spreadsheet values shows spreadsheet ID."""
         error = MagicMock()
         error.resp.status = 404
-        error._get_reason.return_value = "Not Found"
+        error.reason = "Not Found"
         error.uri = (
             "https://sheets.googleapis.com/v4/spreadsheets/1abc123xyz:batchUpdate"
         )
@@ -168,7 +180,7 @@ class TestSheetsErrorHandling:
         """Non-404 errors use base class handling."""
         error = MagicMock()
         error.resp.status = 403
-        error._get_reason.return_value = "Forbidden"
+        error.reason = "Forbidden"
         error.__str__ = lambda self: "403 Forbidden"
         error.uri = "https://sheets.googleapis.com/v4/spreadsheets"
 
@@ -179,8 +191,197 @@ class TestSheetsErrorHandling:
         """404 without URI uses base class handling."""
         error = MagicMock()
         error.resp.status = 404
-        error._get_reason.return_value = "Not Found"
+        error.reason = "Not Found"
         del error.uri
 
         msg = handler._http_error_message(error)
         assert msg == "Not found: Not Found"
+
+
+class TestReadCommand:
+    """Tests for the read command."""
+
+    def test_outputs_rows_as_json(self, service):
+        """Rows are written to stdout as an indented JSON array."""
+        values = service.spreadsheets().values().get
+        values.return_value.execute.return_value = {"values": [["a", "b"], ["1"]]}
+
+        result = CliRunner().invoke(gsheets.cli, ["read", "ID", "--range", "S!A1:B2"])
+
+        assert result.exit_code == 0, result.output
+        assert result.output == json.dumps([["a", "b"], ["1"]], indent=2) + "\n"
+        values.assert_called_once_with(spreadsheetId="ID", range="S!A1:B2")
+        values.return_value.execute.assert_called_once_with(num_retries=5)
+
+    def test_empty_range_outputs_empty_array(self, service):
+        """A range with no values outputs an empty array."""
+        service.spreadsheets().values().get.return_value.execute.return_value = {}
+
+        result = CliRunner().invoke(gsheets.cli, ["read", "ID", "--sheet", "Data"])
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output) == []
+
+    def test_multiple_ranges_fetched_in_one_request(self, service):
+        """--by-range uses a single batchGet, output in input order."""
+        batch_get = service.spreadsheets().values().batchGet
+        batch_get.return_value.execute.return_value = {
+            "valueRanges": [
+                {"range": "Q2!A1:B2", "values": [["q2"]]},
+                {"range": "Q1!A1:B2"},
+            ]
+        }
+
+        result = CliRunner().invoke(
+            gsheets.cli,
+            [
+                "read",
+                "ID",
+                "--by-range",
+                "--range",
+                "Q2!A1:B2",
+                "--range",
+                "Q1\\!A1:B2",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output) == [
+            {"range": "Q2!A1:B2", "values": [["q2"]]},
+            {"range": "Q1!A1:B2", "values": []},
+        ]
+        batch_get.assert_called_once_with(
+            spreadsheetId="ID", ranges=["Q2!A1:B2", "Q1!A1:B2"]
+        )
+        service.spreadsheets().values().get.assert_not_called()
+
+    def test_by_range_shape_for_single_range(self, service):
+        """One --range with --by-range still yields range objects."""
+        batch_get = service.spreadsheets().values().batchGet
+        batch_get.return_value.execute.return_value = {
+            "valueRanges": [{"range": "Q1!A1:B2", "values": [["q1"]]}]
+        }
+
+        result = CliRunner().invoke(
+            gsheets.cli, ["read", "ID", "--by-range", "--range", "Q1!A1:B2"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output) == [{"range": "Q1!A1:B2", "values": [["q1"]]}]
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["--range", "A1", "--sheet", "Data"],
+            ["--range", "A1", "--range", "B1"],
+            ["--by-range"],
+        ],
+    )
+    def test_conflicting_options_rejected(self, service, args):
+        """Ambiguous option combinations are usage errors."""
+        result = CliRunner().invoke(gsheets.cli, ["read", "ID", *args])
+
+        assert result.exit_code == 2
+        service.spreadsheets().values().get.assert_not_called()
+
+
+class TestFirstSheetCache:
+    """Tests for caching the first sheet's title between reads."""
+
+    @pytest.fixture
+    def service(self, service, monkeypatch, tmp_path):
+        """The shared service, answering with a single sheet titled "First"."""
+        monkeypatch.setattr(
+            gsheets, "SHEETS_META_CACHE_FILE", tmp_path / "sheets_meta.json"
+        )
+        get = service.spreadsheets().get
+        get.return_value.execute.return_value = {
+            "sheets": [{"properties": {"title": "First"}}]
+        }
+        values = service.spreadsheets().values().get
+        values.return_value.execute.return_value = {"values": [["x"]]}
+        return service
+
+    def test_repeat_read_skips_metadata_call(self, service):
+        """The second read reuses the cached title."""
+        runner = CliRunner()
+        for _ in range(2):
+            result = runner.invoke(gsheets.cli, ["read", "ID"])
+            assert result.exit_code == 0, result.output
+
+        service.spreadsheets().get.assert_called_once()
+        calls = service.spreadsheets().values().get.call_args_list
+        assert [c.kwargs["range"] for c in calls] == ["First", "First"]
+
+    def test_malformed_entry_refetched(self, service):
+        """A cache entry that isn't a title record is treated as a miss."""
+        gsheets.SHEETS_META_CACHE_FILE.write_text(json.dumps({"ID": None}))
+
+        result = CliRunner().invoke(gsheets.cli, ["read", "ID"])
+
+        assert result.exit_code == 0, result.output
+        service.spreadsheets().get.assert_called_once()
+
+    def test_add_sheet_invalidates(self, service):
+        """Adding a sheet may change which one is first."""
+        batch = service.spreadsheets().batchUpdate
+        batch.return_value.execute.return_value = {
+            "replies": [
+                {"addSheet": {"properties": {"sheetId": 1, "title": "N", "index": 0}}}
+            ]
+        }
+        runner = CliRunner()
+        runner.invoke(gsheets.cli, ["read", "ID"])
+        runner.invoke(gsheets.cli, ["add-sheet", "ID", "N", "--index", "0"])
+        runner.invoke(gsheets.cli, ["read", "ID"])
+
+        assert service.spreadsheets().get.call_count == 2
+
+    def test_stale_title_refetched(self, service):
+        """A 400 on a cached title drops it and retries with a fresh one."""
+        CliRunner().invoke(gsheets.cli, ["read", "ID"])
+        service.spreadsheets().get.return_value.execute.return_value = {
+            "sheets": [{"properties": {"title": "Renamed"}}]
+        }
+        values = service.spreadsheets().values().get
+        values.return_value.execute.side_effect = [
+            HttpError(httplib2.Response({"status": 400}), b"Unable to parse range"),
+            {"values": [["y"]]},
+        ]
+
+        result = CliRunner().invoke(gsheets.cli, ["read", "ID"])
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output) == [["y"]]
+        assert values.call_args.kwargs["range"] == "Renamed"
+
+
+class TestWriteRetries:
+    """Only idempotent writes are retried."""
+
+    def test_write_retries(self, service):
+        """write (values.update) is retried with backoff."""
+        update = service.spreadsheets().values().update
+        update.return_value.execute.return_value = {
+            "updatedRange": "S!A1",
+            "updatedRows": 1,
+            "updatedColumns": 1,
+            "updatedCells": 1,
+        }
+
+        result = CliRunner().invoke(gsheets.cli, ["write", "ID", "S!A1"], input="[[1]]")
+
+        assert result.exit_code == 0, result.output
+        update.return_value.execute.assert_called_once_with(num_retries=5)
+
+    def test_append_not_retried(self, service):
+        """append is not retried, since a repeat could duplicate rows."""
+        append = service.spreadsheets().values().append
+        append.return_value.execute.return_value = {
+            "updates": {"updatedRows": 1, "updatedRange": "S!A1"}
+        }
+
+        result = CliRunner().invoke(gsheets.cli, ["append", "ID"], input="[[1]]")
+
+        assert result.exit_code == 0, result.output
+        append.return_value.execute.assert_called_once_with()